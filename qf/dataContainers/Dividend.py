@@ -1,7 +1,9 @@
 """Implement Dividend class."""
 
 import numpy as np
-import divHelper as divH
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../helperFuncs')))
+import resolveDateTime as divH
 
 class Dividend:
     """This class implements dividend structure."""
@@ -55,32 +57,68 @@ class Dividend:
         """Return, as a string, if dividend is continuous or discrete."""
         return 'discrete' if self.discrete else 'continuous'
 
+    def cumDiscount(self, r=0):
+        """Return running sums of discounted payouts, per rate.
+
+        Parameters
+        ----------
+        r : array_like : Annualized risk-free interest rate(s).
+
+        Returns
+        -------
+        res : array : res[..., k] = discounted sum of the first k payouts,
+            shape r.shape + (# of payouts + 1,).
+
+        """
+        r = np.asarray(r, dtype=float)[..., None]
+        res = np.zeros(r.shape[:-1] + (self.times.size + 1,))
+        np.cumsum(np.exp(-r * self.times) * self.div, axis=-1, out=res[..., 1:])
+        return res
+
     def discount(self, r=0, T=1):
         """Return discounted payouts. (Not generally the present value).
 
         Parameters
         ----------
-        r : float : Annualized risk-free interest rate, continuously compounded.
-        T : float : Time, in years, until maturity.
+        r : array_like : Annualized risk-free interest rate, continuously compounded.
+        T : array_like : Time, in years, until maturity.
 
         Returns
         -------
-        res : func : Discounted dividend.
+        res : float, array : Discounted dividend, r and T broadcast.
+
+        Notes
+        -----
+        Discrete payouts are summed over the payouts at or before T, found
+        by a searchsorted of the (ascending) payout times into 'cumDiscount'
+        of the distinct rates only. Pass r[:, None] and T to get a matrix of
+        rates by maturities.
+
+        Example(s)
+        ----------
+        >>> q = Dividend([.73, .82, .76, .8], times=[.5, 1, 1.5, 2])
+        >>> q.discount(np.array([.04, .05])[:, None], [.75, 2.25])
+        >>> array([[0.71554503, 2.95762649],
+                   [0.71197624, 2.92093935]])
 
         """
+        r, T = np.asarray(r, dtype=float), np.asarray(T, dtype=float)
+        shape = np.broadcast_shapes(r.shape, T.shape)
         if self.discrete:
-            res = np.sum(np.exp(-r * self.times) * self.div)
+            paid = np.broadcast_to(np.searchsorted(self.times, T, side='right'), shape)
+            cumDisc = np.broadcast_to(self.cumDiscount(r), shape + (self.times.size + 1,))
+            res = np.take_along_axis(cumDisc, paid[..., None], -1)[..., 0]
         else:
-            res = np.exp(-self.div * T)
+            res = np.broadcast_to(np.exp(-self.div * T), shape).copy()
             
-        return res
+        return res[()]
 
     def presentValue(self, PV=1, r=0, T=1):
-        """Return the present value."""
+        """Return the present value, r and T broadcast (see discount)."""
         if self.discrete:
-            res = np.sum(np.exp(-r * self.times) * self.div)
+            res = self.discount(r, T)
         else:
-            res = PV*(np.exp((self.div-r)*T) - 1)
+            res = PV*(np.exp((self.div-np.asarray(r))*np.asarray(T)) - 1)
             
         return res
 
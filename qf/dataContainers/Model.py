@@ -1,9 +1,9 @@
 """Implement Model class."""
 
 #from params import techEvals
-import sys
-sys.path.append('../')
-from helperFuncs import showData
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../helperFuncs')))
+import showData
 
 class Model:
     def __init__(self,
@@ -89,7 +89,7 @@ class Model:
 
     @property
     def evals(self):
-        res = [(tech_: techEvals[tech_]) for tech_ in self.pricingTech]
+        res = {tech_: techEvals[tech_] for tech_ in self.pricingTech}
         for r in res:
             print(r)
         return res
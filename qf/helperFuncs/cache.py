@@ -0,0 +1,133 @@
+"""Memoize characteristic functions evaluated on a grid."""
+
+import numpy as np
+from collections import OrderedDict
+
+class LRUCache:
+    """Least recently used cache of arrays, bounded by total memory."""
+
+    def __init__(self, maxBytes=2**26):
+        """Initialize an empty cache holding at most 'maxBytes' of arrays."""
+        self.maxBytes = maxBytes
+        self.store = OrderedDict()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return f'LRUCache(maxBytes={self.maxBytes})'
+
+    def __len__(self):
+        """Return the number of cached arrays."""
+        return len(self.store)
+
+    def get(self, key):
+        """Return the array stored under key (None if absent)."""
+        res = self.store.get(key)
+        if res is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.store.move_to_end(key)
+        return res[0]
+
+    def put(self, key, arr):
+        """Store arr under key, evicting the least recently used arrays.
+
+        Each entry counts the bytes of arr and of the key (see 'keyBytes')
+        toward 'maxBytes', entries larger than 'maxBytes' are not stored.
+        The stored array is made read-only as it is shared by every later
+        caller.
+
+        """
+        size = arr.nbytes + keyBytes(key)
+        if size > self.maxBytes:
+            return arr
+        if key in self.store:
+            self.nbytes -= self.store.pop(key)[1]
+        
+        arr.setflags(write=False)
+        self.store[key] = (arr, size)
+        self.nbytes += size
+        while self.nbytes > self.maxBytes:
+            _, (_, oldSize) = self.store.popitem(last=False)
+            self.nbytes -= oldSize
+            self.evictions += 1
+        return arr
+
+    def clear(self):
+        """Empty the cache and reset the counters."""
+        self.store.clear()
+        self.nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """Return a dict with the hit/miss counts and memory used."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hitRate': self.hits/lookups if lookups else 0.,
+                'evictions': self.evictions, 'entries': len(self.store),
+                'nbytes': self.nbytes, 'maxBytes': self.maxBytes}
+
+phiCache = LRUCache()
+
+def keyBytes(key):
+    """Return the bytes held by the bytes objects in a (nested) tuple key."""
+    if isinstance(key, bytes):
+        return len(key)
+    if isinstance(key, tuple):
+        return sum(keyBytes(x) for x in key)
+    return 0
+
+def gridKey(u):
+    """Return a hashable key identifying the contents of the array u.
+
+    The raw bytes are part of the key, so a lookup compares the full grid
+    and distinct grids never share an entry. They are as large as u and
+    count toward the memory of the cache.
+    """
+    return (u.shape, u.dtype.str, u.tobytes())
+
+def cachedPhi(genPhi, *params, cache=phiCache):
+    """Return a characteristic function that memoizes grid evaluations.
+
+    Parameters
+    ----------
+    genPhi : func : Model function returning a characteristic function, e.g.
+        'Heston.phi', 'VG.phiVG' or a vol-only 'phiVol' of an IV solver.
+    params : floats : Paramaters 'genPhi' is called with.
+    cache  : LRUCache, optional : Cache to store evaluations in.
+
+    Returns
+    -------
+    res : func : Characteristic function of one variable. Array inputs are
+        looked up by (model, paramaters, grid), scalar inputs are evaluated
+        directly.
+
+    Notes
+    -----
+    Returned arrays are read-only, copy them before modifying in place.
+
+    Example(s)
+    ---------
+    >>> phi = cachedPhi(Heston.phi, 100, .08, .5, .2, .004, 2, .04, .3, -.7)
+    >>> Y = np.arange(0, 128, 1/8)
+    >>> A, B = phi(Y - 1j), phi(Y - 1j)
+    >>> A is B, phiCache.info()['hits']
+    >>> (True, 1)
+    
+    """
+    phi = genPhi(*params)
+    modelKey = (genPhi, params)
+
+    def res(u):
+        if np.ndim(u) == 0:
+            return phi(u)
+        u = np.asarray(u)
+        key = (modelKey, gridKey(u))
+        val = cache.get(key)
+        if val is None:
+            val = cache.put(key, np.asarray(phi(u)))
+        return val
+
+    return res
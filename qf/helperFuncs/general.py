@@ -2,7 +2,7 @@
 
 import numpy as np
 import math
-from formatting import makeArray
+from helperFuncs.formatting import makeArray
 
 def isATM(S, K, eps=.01):
     """Return if abs(S-K) <= eps."""
@@ -0,0 +1,76 @@
+"""Supporting functions for the recombining lattice techniques."""
+
+import numpy as np
+from helperFuncs.normal import normCdf
+
+def resolveJump(jump, dT):
+    """Return jump(dT) if the jump size/probability is a callable of dT."""
+    return jump(dT) if callable(jump) else jump
+
+def smoothStep(S, K, r, dT, vol, q, call=True, american=False):
+    """Return the option values one step before expiry, priced by BSM.
+
+    Parameters
+    ----------
+    S        : array : Stock prices of the nodes one step before expiry.
+    K        : float : Strike price of the option.
+    r        : float : Annualized risk-free interest rate, continuously compounded.
+    dT       : float : Length of the final step, in years.
+    vol      : float : Volatility of the stock.
+    q        : float : Continous dividend rate.
+    call     : bool  : If pricing call.
+    american : bool  : If early exercise is allowed at the node.
+
+    Returns
+    -------
+    res : array : Value of the option at each node.
+
+    Notes
+    -----
+    Broadie & Detemple: replacing the last step of the lattice by the
+    closed form removes the payoff kink from the lattice, so the error
+    decays smoothly in the depth and can be extrapolated.
+
+    """
+    sign = 1 if call else -1
+    adjS, adjK = S*np.exp(-q*dT), K*np.exp(-r*dT)
+    stdDev = vol * np.sqrt(dT)
+    d1 = (np.log(S/K) + (r-q)*dT)/stdDev + stdDev/2
+    d2 = d1 - stdDev
+    res = sign * (adjS*normCdf(sign*d1) - adjK*normCdf(sign*d2))
+
+    if american:
+        res = np.maximum(res, sign*(S - K))
+    return res
+
+def richardson(price, depth, order=2):
+    """Extrapolate lattice prices to infinite depth.
+
+    Parameters
+    ----------
+    price : func : Lattice price as a function of the depth.
+    depth : int  : Finest depth, the lattice is also priced at depth/2 (and
+        depth/4 if order = 3).
+    order : int  : Number of depths combined, 2 or 3.
+
+    Returns
+    -------
+    res : float : Extrapolated price.
+
+    Notes
+    -----
+    With V(N) = V + a/N + b/N^2, the prices at N, 2N (and 4N) give:
+
+        V = 2V(2N) - V(N)
+        V = (8V(4N) - 6V(2N) + V(N)) / 3
+
+    The error of a smoothed lattice (see 'smoothStep') follows this
+    expansion, an unsmoothed binomial lattice oscillates in N.
+
+    """
+    weights = {2: (-1, 2), 3: (1/3, -2, 8/3)}
+    if order not in weights:
+        raise ValueError('Richardson extrapolation order must be 2 or 3.')
+    
+    depths = [depth // 2**j for j in range(order-1, -1, -1)]
+    return sum(w * price(N) for w, N in zip(weights[order], depths))
@@ -0,0 +1,63 @@
+"""Standard normal CDF and PDF used by the closed-form techniques."""
+
+import numpy as np
+from scipy.special import erfc
+
+INV_SQRT_2 = 1 / np.sqrt(2)
+INV_SQRT_2PI = 1 / np.sqrt(2*np.pi)
+
+def normCdf(x, out=None):
+    """Return the standard normal CDF of x.
+
+    Parameters
+    ----------
+    x   : float, array : Point(s) to evaluate the CDF at.
+    out : array, optional : Buffer to write the result into, it must have
+        the (broadcast) shape of x and a float dtype. May be x itself.
+
+    Returns
+    -------
+    res : float, array : N(x), written into 'out' if given.
+
+    Notes
+    -----
+    Uses N(x) = erfc(-x/sqrt(2)) / 2, which keeps full relative accuracy
+    in the left tail. Unlike 'scipy.stats.norm().cdf' no distribution
+    object is built and no argument checking is done, and when 'out' is
+    given no temporary arrays are allocated.
+
+    Example(s)
+    ----------
+    >>> normCdf(.5)
+    >>> 0.691462461274013
+
+    >>> normCdf(np.array([-1, 0, 1.]))
+    >>> array([0.15865525, 0.5       , 0.84134475])
+    
+    """
+    res = np.multiply(x, -INV_SQRT_2, out=out)
+    res = erfc(res, out=out)
+    return np.multiply(res, .5, out=out)
+
+def normPdf(x, out=None):
+    """Return the standard normal PDF of x.
+
+    Parameters
+    ----------
+    x   : float, array : Point(s) to evaluate the PDF at.
+    out : array, optional : Buffer to write the result into. (See 'normCdf')
+
+    Returns
+    -------
+    res : float, array : phi(x), written into 'out' if given.
+
+    Example(s)
+    ----------
+    >>> normPdf(.5)
+    >>> 0.35206532676429947
+    
+    """
+    res = np.square(x, out=out)
+    res = np.multiply(res, -.5, out=out)
+    res = np.exp(res, out=out)
+    return np.multiply(res, INV_SQRT_2PI, out=out)
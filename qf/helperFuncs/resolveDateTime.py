@@ -1,7 +1,7 @@
 """Supporting functions for Dividend.py"""
 
 import numpy as np
-from formating import makeArray
+from formatting import makeArray
 
 def discCand(discrete, times, dates):
     """Return if dividend type may be discrete."""
@@ -46,16 +46,16 @@ def extractDiv(div, discrete, times, dates):
     return res
 
 def timeDif(date1, date2):
-    """Return the number of days from start of date1 to start of date2.
+    """Return the number of days from start of date1 to start of date2(s).
 
     Parameters
     ----------
-    date1 : datetime64 : Start date.
-    date2 : datetime64 : End date.
+    date1 : date_like        : Start date.
+    date2 : array_like, date : End date(s).
 
     Returns
     -------
-    - : int : Number of days between two dates.
+    - : int, array : Number of days between the dates.
 
     Example(s)
     ----------
@@ -63,8 +63,8 @@ def timeDif(date1, date2):
     >>> 0
 
     """
-    splitDateDiff = str(date2 - date1).split(' ')
-    return int(splitDateDiff[0])
+    days = np.asarray(date2, dtype='datetime64[D]') - np.datetime64(date1, 'D')
+    return days.astype(np.int64)
 
 def getTimes(discrete, times, dates, startDate):
     """Return an array of times in years of dividend payouts.
@@ -94,10 +94,9 @@ def getTimes(discrete, times, dates, startDate):
     """
     if not discrete:
         res = np.array([np.inf])
-    elif times:
-        res = np.array(times)
+    elif times is not None:
+        res = np.asarray(times, dtype=float)
     else:
-        date_ = np.datetime64(startDate)
-        res = np.array([timeDif(date_, np.datetime64(d)) for d in dates])/365
+        res = timeDif(startDate, dates) / 365
 
     return res
@@ -1,5 +1,10 @@
 import pandas as pd
-import yFinance as yf
+import yfinance as yf
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../time')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../time/offline')))
+import yearFrac
+import calander
 
 def optChain(symbol, date):
     """Return a simplified option-chain for a symbol at a certain expiry."""
@@ -60,8 +65,8 @@ def getRiskFreeRate(T=1):
     spx = yf.Ticker('META')
     optionDates = spx.options
     startDate = tuple(int(x) for x in optionDates[0].split('-')[::-1])
-    endDate = calander.elapsedDays(T*365, startDate)
-    endDay, endMonth, endYear = endDate
+    endDate = calander.addYears(T, startDate)
+    endDay, endMonth, endYear = calander.dt64_tuple(str(endDate))
     estDate = ''
 
     #Get rough options expiry date
@@ -72,7 +77,7 @@ def getRiskFreeRate(T=1):
             spxDate = date
 
     estDate, spxDate = (17, 1, 2025), '2025-01-17' #Delete
-    T_ = calander.dateToYears(startDate, estDate)
+    T_ = yearFrac.dateToYears(startDate, estDate)
     
     #Get spot price
     spotPr = spx.history(interval='1m', period='1d')['Close'][-1]
@@ -1,6 +1,11 @@
 """Implement BSJ model."""
 
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../stochastic/solver')))
+from jumpCases import simulateMerton
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../dataContainers')))
+from Model import Model
 
 def phiBSJ(S, r, T, v, q, jumpInt, jumpMean, jumpVar):
     """Compute the characteristic function for the Heston model.
@@ -72,4 +77,37 @@ def stochDE(S, r, T, v, q, jumpInt, jumpMean, jumpVar):
     res = sSDE(drift=driftVec, diff=diffMat, P=jumpDiffBSJ, rho=rho, T=T)
     return res
 
-BSJ = Model(phi=phiBSJ, stochDiffEq=stochDE)
+def simulate(S, r, T, v, q, jumpInt, jumpMean, jumpVar,
+             steps, sims, rng=np.random):
+    """Simulate BSJ stock paths, exact in distribution on any grid.
+
+    Parameters
+    ----------
+    S    : float : Current price of stock.
+    r    : float : Annualized risk-free interest rate, continuously compounded.
+    T    : float : Time, in years, until maturity.
+    v    : float : Current volatility.
+    q    : float : Continous dividend rate.
+    jumpInt : float : Intesity of jump process. (lambda)
+    ln(1+J) = N(jumpMean, jumpVar)
+    jumpMean: float : Mean of each jump
+    jumpVar : float : Variance of each jump
+    steps   : int   : # of time steps.
+    sims    : int   : # of paths.
+    rng     : Generator : Source of the draws, defaults to np.random.
+
+    Returns
+    -------
+    res : ndarray : Paths, shape (steps+1, sims).
+    
+    Example(s)
+    ---------
+    >>> P = simulate(95, .07, 1, .25, 0, 1, np.log(1.1)-.08, .16, 52, 10**6)
+    >>> np.exp(-.07) * np.maximum(100-P[-1], 0).mean()
+    >>> 16.12 #Closed form, techniques/BSJ/price.bsj: 16.1277
+    
+    """
+    return simulateMerton(S, r, T, v, q, jumpInt, jumpMean, jumpVar,
+                          steps, sims, rng)
+
+BSJ = Model('BSJ', phi=phiBSJ, stochDiffEq=stochDE)
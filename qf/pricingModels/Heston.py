@@ -1,12 +1,16 @@
 """Implement Heston model."""
 
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../dataContainers')))
+from Model import Model
 
-def phi(S, r, T, v, q, kappa, theta, xi, rho):
-    """Compute the characteristic function for the Heston model.
+def phiGrid(u, S, r, T, v, q, kappa, theta, xi, rho, out=None):
+    """Evaluate the Heston characteristic function on a grid.
 
     Parameters
     ----------
+    u    : array : Point(s) to evaluate the characteristic function at.
     S    : float : Current price of stock.
     r    : float : Annualized risk-free interest rate, continuously compounded.
     T    : float : Time, in years, until maturity.
@@ -16,36 +20,103 @@ def phi(S, r, T, v, q, kappa, theta, xi, rho):
     theta: float : Long variance.
     xi   : float : Vol of vol.
     rho  : float : Correlation coefficient.
+    out  : array, optional : Complex buffer, with the shape of u, to write
+        the result into.
 
     Returns
     -------
-    res: function : Characteristic function.
-    
-    Example(s)
-    ---------
-    >>> 
-    >>> 
+    res : array : phi(u), written into 'out' if given.
+
+    Notes
+    -----
+    Every intermediate (A, d, g, exp(-dT), ...) is computed once per grid
+    and the temporaries are updated in place, see 'phi' for the closed
+    form.
     
     """
     xiSq = xi**2
     varSq = v**4
-    lnS = np.log(S)
+    shape = np.shape(u)
+    u = np.atleast_1d(np.asarray(u, dtype=complex))
+
+    A = (-1j*rho*xi) * u
+    A += kappa
+    d = u * u
+    d += 1j*u
+    d *= xiSq
+    d += A*A
+    np.sqrt(d, out=d)
+
+    Am = A - d #A - d
+    g = A
+    g += d
+    np.divide(Am, g, out=g) #(A-d) / (A+d)
     
-    A = lambda u: kappa - 1j*u*rho*xi
-    d = lambda u: np.sqrt(A(u)**2 + (u**2 + 1j*u)*xiSq)
-    g = lambda u: (A(u)-d(u)) / (A(u)+d(u))
+    twiD = d
+    twiD *= -T
+    np.exp(twiD, out=twiD)
+    gD = g * twiD
+    
+    lnRat = np.log1p(-gD)
+    lnRat -= np.log1p(-g)
+    
+    ratio = Am
+    ratio /= xiSq
+    
+    gD -= 1 #g*twiD - 1
+    twiD -= 1 #twiD - 1
+    twiD /= gD
+    twiD *= varSq #varSq * (1-twiD) / (1-g*twiD)
+    twiD += theta*kappa*T
+    twiD *= ratio
+    
+    lnRat *= -2*theta*kappa/xiSq
+    lnRat += twiD
+    lnRat += (1j*(np.log(S) + (r-q)*T)) * u
 
-    twiD = lambda u: np.exp(-T * d(u))
-    lnRat = lambda u: np.log(1 - g(u)*twiD(u)) - np.log(1 - g(u))
-    ratio = lambda u: (A(u)-d(u)) / xiSq
+    if out is None:
+        return np.exp(lnRat, out=lnRat).reshape(shape)
+    return np.exp(lnRat.reshape(shape), out=out)
 
-    lnPhi = lambda u: (1j*u*lnS + 1j*u*(r-q)*T + ratio(u)*theta*kappa*T
-                       - 2*theta*kappa * lnRat(u)/xiSq
-                       + varSq*ratio(u) * (1-twiD(u)) / (1-g(u)*twiD(u)))
+def phi(S, r, T, v, q, kappa, theta, xi, rho):
+    """Compute the characteristic function for the Heston model.
 
-    phi = lambda u: np.exp(lnPhi(u))
+    Parameters
+    ----------
+    S    : float : Current price of stock.
+    r    : float : Annualized risk-free interest rate, continuously compounded.
+    T    : float : Time, in years, until maturity.
+    v    : float : Current volatility.
+    q    : float : Continous dividend rate.
+    kappa: float : Rate variance reverts to long variance.
+    theta: float : Long variance.
+    xi   : float : Vol of vol.
+    rho  : float : Correlation coefficient.
+
+    Returns
+    -------
+    res: function : Characteristic function, phi(u, out=None).
 
-    return phi
+    Notes
+    -----
+    With A = kappa - i*u*rho*xi, d = sqrt(A^2 + (u^2 + i*u)*xi^2),
+    g = (A-d)/(A+d) and D = exp(-T*d):
+
+        ln(phi(u)) = i*u*(ln(S) + (r-q)*T) + (A-d)*theta*kappa*T/xi^2
+                     - 2*theta*kappa * ln((1-g*D)/(1-g))/xi^2
+                     + v^4 * (A-d)/xi^2 * (1-D)/(1-g*D)
+
+    Evaluation is done by 'phiGrid'.
+    
+    Example(s)
+    ---------
+    >>> 
+    >>> 
+    
+    """
+    res = lambda u, out=None: phiGrid(u, S, r, T, v, q, kappa,
+                                      theta, xi, rho, out=out)
+    return res
 
 def stochDE(S, r, T, v, q, kappa, theta, xi, rho):
     """Compute the characteristic function for the Heston model.
@@ -83,4 +154,4 @@ def stochDE(S, r, T, v, q, kappa, theta, xi, rho):
     res = sSDE(drift=driftVec, diff=diffMat, P=standardBM, rho=rho, T=T)
     return res
     
-Heston = Model(phi=phiHes, stochDiffEq=stochDE)
+Heston = Model('Heston', phi=phi, stochDiffEq=stochDE)
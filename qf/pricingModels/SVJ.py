@@ -1,6 +1,12 @@
 """Implement Heston model."""
 
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../stochastic/solver')))
+from jumpCases import simulateBates
+from Heston import phiGrid
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../dataContainers')))
+from Model import Model
 
 def phiSVJ(S, r, T, v, q, kappa, theta, xi, rho, jumpInt, jumpMean, jumpVar):
     """Compute the characteristic function for the Heston model.
@@ -24,7 +30,7 @@ def phiSVJ(S, r, T, v, q, kappa, theta, xi, rho, jumpInt, jumpMean, jumpVar):
 
     Returns
     -------
-    res: function : Characteristic function.
+    res: function : Characteristic function, phi(u, out=None).
     
     Example(s)
     ---------
@@ -41,8 +47,11 @@ def phiSVJ(S, r, T, v, q, kappa, theta, xi, rho, jumpInt, jumpMean, jumpVar):
                                - 1j*u*jVarHalf)
     
     lnPhiJump = lambda u: T*jumpInt * (-1 + varComp(u))
-    phiHes = phiHeston(S, r-jumpInt*jBar, T, v, q, kappa, theta, xi, rho)
-    phi = lambda u: np.exp(lnPhiJump(u)) * phiHes(u)
+    
+    def phi(u, out=None):
+        res = phiGrid(u, S, r-jumpInt*jBar, T, v, q, kappa, theta, xi, rho, out)
+        res *= np.exp(lnPhiJump(u))
+        return res
 
     return phi
 
@@ -88,5 +97,37 @@ def stochDE(S, r, T, v, q, kappa, theta, xi, rho, jumpInt, jumpMean, jumpVar):
     jumpDiffSVJ = JumpDiffusion(standard.BM, JumpSVJ, T)
     res = sSDE(drift=driftVec, diff=diffMat, P=jumpDiffSVJ, rho=rho, T=T)
     return res
+
+def simulate(S, r, T, v, q, kappa, theta, xi, rho, jumpInt, jumpMean, jumpVar,
+             steps, sims, rng=np.random):
+    """Simulate SVJ stock and variance paths.
+
+    Parameters
+    ----------
+    S    : float : Current price of stock.
+    r    : float : Annualized risk-free interest rate, continuously compounded.
+    T    : float : Time, in years, until maturity.
+    v    : float : Current volatility.
+    q    : float : Continous dividend rate.
+    kappa: float : Rate variance reverts to long variance.
+    theta: float : Long variance.
+    xi   : float : Vol of vol.
+    rho  : float : Correlation coefficient.
+    jumpInt : float : Intesity of jump process. (lambda)
+
+    ln(1+J) = N(jumpMean, jumpVar)
+    jumpMean: float : Mean of each jump
+    jumpVar : float : Variance of each jump
+    steps   : int   : # of time steps.
+    sims    : int   : # of paths.
+    rng     : Generator : Source of the draws, defaults to np.random.
+
+    Returns
+    -------
+    tuple : Stock paths and variance paths, each shape (steps+1, sims).
+    
+    """
+    return simulateBates(S, r, T, v, q, kappa, theta, xi, rho,
+                         jumpInt, jumpMean, jumpVar, steps, sims, rng)
     
-SVJ = Model(phi=phiSVJ, stochDiffEq=stochDE)
+SVJ = Model('SVJ', phi=phiSVJ, stochDiffEq=stochDE)
@@ -1,8 +1,8 @@
 """Implement Index class."""
 
 import numpy as np
-import sys
-sys.path.append('../')
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
 from helperFuncs import formatting, showData
 
 class Index:
@@ -160,7 +160,8 @@ class Index:
         return str(self.I)
 
 
-a = Index(discreteSet = [1, 2, 3, 5, 6, 7])
-b = a.restrict(-7, -5)
-print(a.makeDiscrete(steps=10))
+if __name__ == "__main__":
+    a = Index(discreteSet = [1, 2, 3, 5, 6, 7])
+    b = a.restrict(-7, -5)
+    print(a.makeDiscrete(steps=10))
 
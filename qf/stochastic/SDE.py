@@ -2,28 +2,41 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../')))
+from helperFuncs import general, showData
 from Index import Index
-from solver.simulateSDE import *
-sys.path.append('../')
-from helperFuncs import general, formatting, showData
+from solver.generalCases import simulateSDE
+
+def makeCallable(f):
+    """Return f if callable, else the constant function (t, X) -> f."""
+    return f if callable(f) else (lambda t, X: f)
+
+def wrapProc(X):
+    """Wrap a single object into a list."""
+    return list(X) if isinstance(X, (list, tuple)) else [X]
 
 class SDE:
     """dX_t = f*dt + g_1*dP_1 + ... + g_N*dP_N for t in I."""
-    def __init__(self, drift, diffusion, dP, seed=0, rho=None, index=None):
+    def __init__(self, drift, diffusion, dP, seed=0, rho=None, index=None,
+                 diffDeriv=None):
         """
-        drift     : func with single output.
-        diffusion : list of funcs each with single output.
+        drift     : func f(t, X) (or constant) with single output.
+        diffusion : list of funcs g_j(t, X) (or constants), single output.
         dP        : list of all driving Levy Proc.
         seed      : float, is the init value.
-        rho       : correlation between proc.
-        index     : type = Index.
+        rho       : correlation matrix between proc.
+        index     : type = Index, defaults to [0, 1].
+        diffDeriv : list of funcs dg_j/dX(t, X), used by Milstein.
         """
-        self.drift = drift
-        self.diffusion = formatting.makeCallable(diffusion)
-        self.dP = dP
+        self.drift = makeCallable(drift)
+        self.diffusion = [makeCallable(g) for g in wrapProc(diffusion)]
+        self.dP = wrapProc(dP)
         self.seed = seed
         self.rho = rho
-        self.I = Index() if index is None else Index
+        self.I = Index(0, 1) if index is None else index
+        self.diffDeriv = (None if diffDeriv is None else
+                          [makeCallable(g) for g in wrapProc(diffDeriv)])
 
     @property
     def numProccess(self):
@@ -50,16 +63,36 @@ class SDE:
         """Return repr(self)."""
         return showData.makeRepr(self.initData)
     
-    def simulate(self, sims, steps=100, start=None, end=None):
-        """Simulate the SDE on a subIndex."""
+    def simulate(self, sims, steps=100, start=None, end=None,
+                 scheme='euler', path=True, rng=np.random):
+        """Simulate the SDE on a subIndex.
+
+        Paramaters
+        ----------
+        sims   : int  : # of paths.
+        steps  : int  : # of time steps, if the index is continuous.
+        scheme : str  : 'euler' or 'milstein' (needs diffDeriv).
+        path   : bool : Return paths (steps+1, sims), else X_T (sims,).
+        rng    : Generator : Source of the draws, defaults to np.random.
+
+        """
         idx = self.I.restrict(start, end)
-        sampleSet, increments = idx.makeDiscrete(steps=steps)
+        sampleSet, increments = idx.makeDiscrete(steps=steps+1)
         singleInc = general.equalStepSize(increments)
-        res = simulateSDE(self.drift, self.diff, self.dP, steps,
-                          sims, self.seed, sampleSet, increments,
-                          singleInc)
+        if singleInc:
+            increments = np.mean(increments)
+        diffDeriv = self.diffDeriv if scheme == 'milstein' else None
+        res = simulateSDE(self.drift, self.diffusion, self.dP,
+                          len(sampleSet)-1, sims, self.seed, sampleSet,
+                          increments, singleInc, rho=self.rho,
+                          diffDeriv=diffDeriv, path=path, rng=rng)
         return res
 
+    def discretize(self, sims, steps=100, path=True, rng=np.random,
+                   scheme='euler'):
+        """Return [X], X the paths or X_T (see MonteCarlo/SDE/priceEU)."""
+        return [self.simulate(sims, steps, scheme=scheme, path=path, rng=rng)]
+
     def graph(self, sims, steps=100, start=None, end=None):
         """Graph simulated paths."""
         paths = self.simulate(sims, steps=100, start=None, end=None)
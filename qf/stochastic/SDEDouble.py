@@ -2,6 +2,9 @@
 
 import numpy as np
 import matplotlib.pyplot as plt
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'solver')))
+from optimizedCases import hestonQE
 
 class SimpleSDE2:
     def __init__(self, S_0, v_0, r, q, kappa, theta, xi, rho, jumpProc=None):
@@ -10,20 +13,57 @@ class SimpleSDE2:
         self.shift_v = kappa*theta
         self.drift_v = -kappa
         self.scalBM_v = xi
-        self.cov = [[1, rho], [rho, 1]]
+        self.kappa = kappa
+        self.theta = theta
+        self.rho = rho
         self.seed = [S_0, v_0]
         self.jumpProc = jumpProc
         
-    def simulate(self, sims, steps, start=0, end=1):
+    def simulate(self, sims, steps, start=0, end=1, rng=np.random,
+                 scheme='QE'):
+        """Simulate stock and variance paths.
+
+        Paramaters
+        ----------
+        sims   : int   : # of paths.
+        steps  : int   : # of time steps.
+        rng    : Generator : Source of the draws, defaults to np.random.
+        scheme : str   : 'QE' (Andersen, accurate at 12-50 steps a year) or
+                         'euler' (reflected Euler, needs ~1000 steps).
+
+        Returns
+        -------
+        tuple : Stock paths and variance paths, each shape (steps+1, sims).
+        
+        """
         dt = (end-start)/steps; dtRoot = np.sqrt(dt)
         
         S = np.zeros((steps+1, sims)); S[0] = self.seed[0]
-        v = np.zeros((steps+1, sims)); v[0] = self.seed[1]
-        dW = np.random.multivariate_normal([0,0], self.cov, (steps, sims))*dtRoot
-        dWS, dWv = dW[:,:,0], dW[:,:,1]
         if self.jumpProc is not None:
-            J = self.jumpProc.sample(steps*sims, dt, (steps, sims))
+            J = self.jumpProc.sample(steps*sims, dt, (steps, sims), rng)
         else:
+            J = None
+
+        if scheme == 'QE':
+            dlnS, v = hestonQE(self.seed[1], self.driftS, self.kappa,
+                               self.theta, self.scalBM_v, self.rho,
+                               dt, steps, sims, rng)
+            np.exp(dlnS, out=dlnS)
+            if J is None:
+                S[1:] = self.seed[0] * np.cumprod(dlnS, axis=0)
+            else:
+                for i in range(1, steps+1):
+                    S[i] = S[i-1]*dlnS[i-1] + J[i-1]
+            return S, v
+
+        v = np.zeros((steps+1, sims)); v[0] = self.seed[1]
+        #correlate two normals by the 2x2 Cholesky factor
+        dWS = rng.standard_normal((steps, sims))
+        dWv = rng.standard_normal((steps, sims))
+        dWv *= np.sqrt(1 - self.rho**2)
+        dWv += self.rho*dWS
+        dWS *= dtRoot; dWv *= dtRoot
+        if J is None:
             J = np.zeros((steps, sims))
 
         mulS = 1 + self.driftS*dt
@@ -24,7 +24,7 @@ class SimpleSDE:
     def numProc(self):
         return len(self.diffusion)
 
-    def simulate(self, sims, steps, start=0, end=1):
+    def simulate(self, sims, steps, start=0, end=1, rng=np.random):
         dt = (end-start)/steps
 
         #container for sim paths
@@ -34,7 +34,8 @@ class SimpleSDE:
         #Realize Stoch Procs
         dP = np.zeros((numProc, steps, sims))
         for i, proc in enumerate(self.P):
-            dP[i] = proc.sample(sims=steps*sims, idx=dt, shape=(steps, sims))
+            dP[i] = proc.sample(sims=steps*sims, idx=dt, shape=(steps, sims),
+                                rng=rng)
             dP[i] *= self.diffusion[i]
 
         dP = dP.sum(axis=0)
@@ -17,13 +17,14 @@ class BrownianMotion:
         repData = f'drift={self.drift}, mag={self.mag}, index={repr(self.index)}'
         return f'BrownianMotion({repData})'
     
-    def sample(self, sims, idx, shape=None):
+    def sample(self, sims, idx, shape=None, rng=np.random):
         """Sample X_t.
 
         Paramaters
         ----------
         sims  : int   : # of simulations drawn at each point in time.
         idx   : float : Provides instance of SP being sampled.
+        rng   : Generator : Source of the draws, defaults to np.random.
 
         Returns
         -------
@@ -32,7 +33,7 @@ class BrownianMotion:
         """
         if shape is None:
             shape = sims
-        noise = np.random.normal(loc=0.0, scale=np.sqrt(idx), size=shape)
+        noise = rng.normal(loc=0.0, scale=np.sqrt(idx), size=shape)
         det = 0 if self.drift==0 else self.drift*idx
         return det + self.mag*noise
 
@@ -22,34 +22,35 @@ class CompoundPoisson:
         
         return f'CompoundPoisson({repData1}, {repData2})'
 
-    def sample(self, sims, idx, shape=None):
+    def sample(self, sims, idx, shape=None, rng=np.random):
         """Sample X_t.
 
         Paramaters
         ----------
         sims  : int   : # of simulations drawn at each point in time.
         idx   : float : Provides instance of SP being sampled.
+        shape : tuple, optional : Shape of the samples, e.g. (steps, sims).
+        rng   : Generator : Source of the draws, defaults to np.random.
 
         Returns
         -------
-        res : ndarray : Array with 'sims' number of samples.
+        res : ndarray : Array with 'sims' number of samples, or 'shape'.
         
         """
         if shape is None:
             shape = sims
 
-        realizePoisson = np.random.poisson(lam=self.lam*idx, size=sims)
-        realizeJumps = np.random.lognormal(
+        realizePoisson = rng.poisson(lam=self.lam*idx, size=shape)
+        counts = realizePoisson.ravel()
+        realizeJumps = rng.lognormal(
             mean=self.logNormMean,
             sigma=self.logNormDev,
-            size=np.sum(realizePoisson)
+            size=np.sum(counts)
             )
-        
-        noise = np.zeros(sims)
-        prev = 0
-        for i, N_t in enumerate(realizePoisson):
-            noise[i] = np.sum(realizeJumps[prev:prev+N_t])
-            prev += N_t
+
+        #jump i belongs to simulation owner[i], sum jumps per simulation
+        owner = np.repeat(np.arange(counts.size), counts)
+        noise = np.bincount(owner, weights=realizeJumps, minlength=counts.size)
 
         noise = noise.reshape(shape)
         struc = idx
@@ -14,13 +14,14 @@ class GammaProcess:
         self.mag = mag
         self.index = [start, end]
         
-    def sample(self, sims, idx, shape=None):
+    def sample(self, sims, idx, shape=None, rng=np.random):
         """Sample X_t.
 
         Paramaters
         ----------
         sims  : int   : # of simulations drawn at each point in time.
         idx   : float : Provides instance of SP being sampled.
+        rng   : Generator : Source of the draws, defaults to np.random.
 
         Returns
         -------
@@ -30,7 +31,7 @@ class GammaProcess:
         if shape is None:
             shape = sims
             
-        noise = np.random.gamma(self.theta*idx, scale=1/self.lam, size=shape)
+        noise = rng.gamma(self.theta*idx, scale=1/self.lam, size=shape)
         struc = idx
         return self.drift*struc + self.mag*noise
         
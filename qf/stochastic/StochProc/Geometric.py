@@ -25,13 +25,14 @@ class Geometric:
         self.X = X
         self.index = X.index if end is None else [start, end]
         
-    def sample(self, sims, idx, shape=None):
+    def sample(self, sims, idx, shape=None, rng=np.random):
         """Sample X_t.
 
         Paramaters
         ----------
         sims  : int   : # of simulations drawn at each point in time.
         idx   : float : Provides instance of SP being sampled.
+        rng   : Generator : Source of the draws, defaults to np.random.
         scale : float : End scaling of samples.
 
         Returns
@@ -41,7 +42,7 @@ class Geometric:
         """
         if shape is None:
             shape = sims
-        noise = np.exp(self.X.sample(sims, idx, shape))
+        noise = np.exp(self.X.sample(sims, idx, shape, rng))
         det = 0 if self.drift==0 else self.drift*idx
         return det + self.mag*noise
 
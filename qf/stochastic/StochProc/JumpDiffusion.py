@@ -24,7 +24,7 @@ class JumpDiffusion:
                                   mag=magJP, start=0, end=1)
         self.index = [start, end]
 
-    def sample(self, sims, idx, shape=None):
+    def sample(self, sims, idx, shape=None, rng=np.random):
         """Sample X_t.
 
         Paramaters
@@ -32,6 +32,7 @@ class JumpDiffusion:
         self : JumpDiffusion  : Stochastic proccess being sampled.
         sims : int            : # of simulations drawn at each point in time.
         t    : float, optional: Provides instance of SP being sampled.
+        rng  : Generator      : Source of the draws, defaults to np.random.
 
         Returns
         -------
@@ -40,8 +41,8 @@ class JumpDiffusion:
         """
         if shape is None:
             shape = sims
-        noise = self.BM.sample(sims, idx, shape)
-        jumps = self.JP.sample(sims, idx, shape)
+        noise = self.BM.sample(sims, idx, shape, rng)
+        jumps = self.JP.sample(sims, idx, shape, rng)
         return self.drift*idx + noise + jumps
         
     def graph(self, numPaths=1, steps=100):
@@ -0,0 +1,168 @@
+"""Implement a randomized quasi-Monte Carlo (scrambled Sobol) generator."""
+
+import numpy as np
+from scipy.stats import qmc, poisson, gamma
+from scipy.special import ndtri
+
+def bridgeSchedule(steps):
+    """Return the Brownian bridge fill order for 'steps' unit time steps.
+
+    Each entry is (mid, left, right) with W[mid] built from W[left],
+    W[right] and one new normal. Bisection is breadth first so the leading
+    Sobol coordinates drive the coarse shape of the path.
+    """
+    schedule, queue = [], [(0, steps)]
+    while queue:
+        left, right = queue.pop(0)
+        if right - left < 2:
+            continue
+        mid = (left + right) // 2
+        schedule.append((mid, left, right))
+        queue += [(left, mid), (mid, right)]
+
+    return schedule
+
+def brownianBridge(Z):
+    """Map normals of shape (steps, sims) to bridge-ordered increments.
+
+    Row 0 sets the endpoint W[steps], the rest fill in by bisection. The
+    increments are iid N(0, 1), like the rows of Z.
+    """
+    steps = Z.shape[0]
+    W = np.zeros((steps+1,) + Z.shape[1:])
+    W[steps] = np.sqrt(steps) * Z[0]
+    for k, (mid, left, right) in enumerate(bridgeSchedule(steps), 1):
+        a, b = mid - left, right - mid
+        W[mid] = (b*W[left] + a*W[right])/(a+b) + np.sqrt(a*b/(a+b))*Z[k]
+
+    return np.diff(W, axis=0)
+
+class SobolRNG:
+    """Scrambled Sobol drop-in for the np.random draws of a simulation."""
+
+    def __init__(self, dim, seed=None, sims=None):
+        """Initialize SobolRNG paramaters.
+
+        Paramaters
+        ----------
+        dim  : int : Total # of coordinates used by one simulated path.
+        seed : int or SeedSequence, optional : Seed of the scrambling.
+        sims : int, optional : # of points, else set by the first draw.
+
+        Initializes
+        -----------
+        self.dim      : int       : Coordinates per point.
+        self.engine   : Sobol     : Scrambled Sobol sequence.
+        self.fallback : Generator : Draws which do not fit the point set.
+        self.points   : ndarray   : Uniforms of shape (dim, sims).
+        self.cursor   : int       : Next unused coordinate.
+
+        """
+        self.dim = dim
+        seedSeq = seed
+        if not isinstance(seed, np.random.SeedSequence):
+            seedSeq = np.random.SeedSequence(seed)
+        engineSeed, fallbackSeed = seedSeq.spawn(2)
+        self.engine = qmc.Sobol(dim, scramble=True,
+                                seed=np.random.default_rng(engineSeed))
+        self.fallback = np.random.default_rng(fallbackSeed)
+        self.points = None if sims is None else self.engine.random(sims).T
+        self.cursor = 0
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return f'SobolRNG(dim={self.dim}, cursor={self.cursor})'
+
+    def uniforms(self, size):
+        """Return the next coordinates of the point set, reshaped to 'size'.
+
+        The # of points is fixed by the first call; a draw of 'size' uses
+        prod(size)/sims coordinates. Returns None if 'size' is not a
+        multiple of the # of points.
+        """
+        size = (size,) if np.isscalar(size) else tuple(size)
+        total = int(np.prod(size))
+        if self.points is None:
+            self.points = self.engine.random(size[-1]).T
+        sims = self.points.shape[1]
+        if total % sims:
+            return None
+
+        k = total // sims
+        if self.cursor + k > self.dim:
+            raise ValueError(f'SobolRNG ran out of coordinates (dim={self.dim})')
+        U = self.points[self.cursor:self.cursor+k]
+        self.cursor += k
+        return U.reshape(size)
+
+    def standard_normal(self, size):
+        """Return N(0, 1) draws, bridge ordered along axis 0 of (steps, sims)."""
+        U = self.uniforms(size)
+        if U is None:
+            return self.fallback.standard_normal(size)
+        Z = ndtri(U)
+        if Z.ndim == 2 and Z.shape[0] > 1:
+            Z = brownianBridge(Z)
+        return Z
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        """Return N(loc, scale**2) draws."""
+        return loc + scale*self.standard_normal(size)
+
+    def lognormal(self, mean=0.0, sigma=1.0, size=None):
+        """Return exp(N(mean, sigma**2)) draws."""
+        return np.exp(self.normal(mean, sigma, size))
+
+    def multivariate_normal(self, mean, cov, size):
+        """Return correlated normals, shape = size + (len(mean),).
+
+        Each component is bridge ordered along axis 0 of 'size'.
+        """
+        size = (size,) if np.isscalar(size) else tuple(size)
+        Z = np.stack([self.standard_normal(size) for _ in mean], axis=-1)
+        return np.asarray(mean) + Z @ np.linalg.cholesky(cov).T
+
+    def poisson(self, lam=1.0, size=None):
+        """Return Poisson draws by inversion."""
+        U = self.uniforms(size)
+        if U is None:
+            return self.fallback.poisson(lam, size)
+        return poisson.ppf(U, lam).astype(np.int64)
+
+    def gamma(self, shape, scale=1.0, size=None):
+        """Return Gamma draws by inversion."""
+        U = self.uniforms(size)
+        if U is None:
+            return self.fallback.gamma(shape, scale, size)
+        return gamma.ppf(U, shape, scale=scale)
+
+def rqmc(sampler, sims, *args, dim=1, reps=16, seed=None):
+    """Estimate the mean of a sampler by randomized QMC.
+
+    Parameters
+    ----------
+    sampler : func : sampler(sims, rng, *args), returns an array of samples.
+    sims    : int  : Points per replication, ideally a power of 2.
+    args    : *    : Extra arguments passed to the sampler.
+    dim     : int  : Coordinates used by one sample (e.g. steps).
+    reps    : int  : # of independent scramblings.
+    seed    : int, optional : Root seed of the scramblings.
+
+    Returns
+    -------
+    tuple : Mean of the samples, standard error of the mean.
+
+        The error is estimated from the spread of the 'reps' independent
+        replication means.
+
+    Example(s)
+    ---------
+    >>> rqmc(sampleEU, 2**14, S_t, 40, .06, 1, False, seed=7)
+    >>> (5.119080619370234, 5.841381142251474e-06)
+
+    """
+    streams = np.random.SeedSequence(seed).spawn(reps)
+    means = np.array([np.mean(sampler(sims, SobolRNG(dim, stream, sims), *args))
+                      for stream in streams])
+
+    return means.mean(), means.std(ddof=1) / np.sqrt(reps)
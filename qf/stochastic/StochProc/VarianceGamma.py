@@ -17,12 +17,12 @@ class VarianceGamma:
         self.magVG = magVG
         self.index = [start, end]
 
-    def sample(self, sims, idx, shape=None):
+    def sample(self, sims, idx, shape=None, rng=np.random):
         """Sample X_t."""
         if shape is None:
             shape = sims
-        gammaTimes = self.GP.sample(sims, idx, shape)
-        BMvals = self.BM.sample(sims, gammaTimes, shape)
+        gammaTimes = self.GP.sample(sims, idx, shape, rng)
+        BMvals = self.BM.sample(sims, gammaTimes, shape, rng)
         return self.drift*idx + self.magVG*(BMvals + gammaTimes)
         
     def graph(self, numPaths=1, steps=100):
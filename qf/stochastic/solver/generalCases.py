@@ -3,7 +3,7 @@
 import numpy as np
 
 def simulate_oneProc(drift, diff, underlyingProc, steps,
-                     sims, seed, sampleSet, increments):
+                     sims, seed, sampleSet, increments, rng=np.random):
     """Apply EM when dX_t = f(t, X)dt + g(t, X)dY_t for Levy process Y.
     drift is a func
     diff is a func
@@ -15,14 +15,14 @@ def simulate_oneProc(drift, diff, underlyingProc, steps,
     X[0] = seed
     reqSims = steps*sims
     dUnderlying = underlyingProc.sample(sims=reqSims, idx=dt_,
-                                        shape=(steps, sims))
+                                        shape=(steps, sims), rng=rng)
     for i, t in enumerate(sampleSet, 1):
         X[i] = X[i-1] + drift(t, X[i-1])*dt_ + diff(t, X[i-1])*dUnderlying[i-1]
 
     return X
 
 def simulate_multProc(drift, diff, underlyingProc, steps,
-                     sims, seed, sampleSet, increments):
+                     sims, seed, sampleSet, increments, rng=np.random):
     """Apply EM. All procs are Levy. drift and diff[i] are func in 2 var."""
     #generate solution container and step size
     dt_, X = increments, np.zeros((steps+1, sims))
@@ -33,7 +33,8 @@ def simulate_multProc(drift, diff, underlyingProc, steps,
     dUnderlying = np.array((numProc, steps, sims))
     reqSims = steps*sims
     for i, Levy in enumerate(underlyingProc):
-        dUnderlying[i] = Levy.sample(sims=reqSims, idx=dt_, shape=(steps, sims))
+        dUnderlying[i] = Levy.sample(sims=reqSims, idx=dt_,
+                                     shape=(steps, sims), rng=rng)
 
     #simulate solution
     for i, t in enumerate(sampleSet, 1):
@@ -43,23 +44,81 @@ def simulate_multProc(drift, diff, underlyingProc, steps,
         
     return X
 
-def simulateSDE(drift, diff, underlyingProc, steps,
-                sims, seed, sampleSet, increments, singleInc):
-    dt_ = np.ones((steps,)) * increments if singleInc else increments
-    X = np.zeros((steps+1, sims)); X[0] = seed
+def drawIncrements(underlyingProc, inc, sims, rho=None, rng=np.random):
+    """Draw the increments of every driving process over a block of steps.
 
-    numProc = len(underlyingProc)
-    dUnderlying = np.array((numProc, steps, sims))
-    reqSims = steps*sims
+    Each process is sampled in one call of shape (len(inc), sims). If 'rho'
+    (a correlation matrix) is given, the increments are correlated by its
+    Cholesky factor, which is exact for Brownian drivers.
+    """
+    steps = len(inc)
+    idx = inc[:, None]
+    dP = np.empty((len(underlyingProc), steps, sims))
     for i, Levy in enumerate(underlyingProc):
-        for j, inc in enumerate(dt_):
-            dUnderlying[i][j] = Levy.sample(sims=reqSims, idx=inc,
-                                            shape=(sims,))
+        dP[i] = Levy.sample(sims=steps*sims, idx=idx,
+                            shape=(steps, sims), rng=rng)
+    if rho is not None:
+        L = np.linalg.cholesky(rho)
+        dP = np.tensordot(L, dP, axes=1)
+
+    return dP
+
+def simulateSDE(drift, diff, underlyingProc, steps,
+                sims, seed, sampleSet, increments, singleInc,
+                rho=None, diffDeriv=None, path=True, block=64,
+                rng=np.random):
+    """Apply EM (or Milstein) to dX_t = f(t, X)dt + sum_j g_j(t, X)dP^j_t.
+
+    Parameters
+    ----------
+    drift          : func  : f(t, X), vectorized in X.
+    diff           : list  : g_j(t, X), one per driving process.
+    underlyingProc : list  : Driving Levy processes P^j.
+    steps          : int   : # of time steps.
+    sims           : int   : # of paths.
+    seed           : float : X_0.
+    sampleSet      : array : Times, the left end of step i is sampleSet[i].
+    increments     : float or array : Step size(s).
+    singleInc      : bool  : If all steps have size 'increments'.
+    rho            : array, optional : Correlation matrix of the drivers.
+    diffDeriv      : list, optional  : dg_j/dX(t, X), adds the Milstein
+                                       correction (for Brownian drivers).
+    path           : bool  : Keep the whole path, else only X_T.
+    block          : int   : # of steps drawn per batch.
+    rng            : Generator : Source of the draws, defaults to np.random.
+
+    Returns
+    -------
+    res : ndarray : Paths, shape (steps+1, sims), or X_T, shape (sims,).
+
+    Notes
+    -----
+    Increments are drawn 'block' steps at a time for all drivers, so with
+    path=False memory is O(block*sims) rather than O(steps*sims). The
+    Milstein term 1/2*g_j*g_j'*(dP_j**2 - dt) is the commutative-noise
+    form, exact for one driver.
+
+    """
+    dt_ = np.full(steps, increments) if singleInc else np.asarray(increments)
+    X = np.empty((steps+1, sims)) if path else np.empty(sims)
+    x = X[0] if path else X
+    x[...] = seed
+
+    for b in range(0, steps, block):
+        inc = dt_[b:b+block]
+        dP = drawIncrements(underlyingProc, inc, sims, rho, rng)
+        for k, dt in enumerate(inc):
+            t = sampleSet[b+k]
+            dx = drift(t, x)*dt
+            for j, g in enumerate(diff):
+                g_ = g(t, x)
+                dx = dx + g_*dP[j, k]
+                if diffDeriv is not None:
+                    dx = dx + .5*g_*diffDeriv[j](t, x)*(dP[j, k]**2 - dt)
+            if path:
+                X[b+k+1] = x + dx
+                x = X[b+k+1]
+            else:
+                x += dx
 
-    for i, t in enumerate(sampleSet, 1):
-        for j in range(numProcs):
-            X[i] += diff[j](t, X[i-1]) * dUnderlying[j][i-1]
-        X[i] = (X[i-1] + drift(t, X[i-1])*dt_)
-        
     return X
-    
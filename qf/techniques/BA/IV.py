@@ -1,7 +1,9 @@
 """Solve for IV in Black's approximation."""
 
-from scipy.stats import norm
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.normal import normCdf
 
 def freqVol(vol, rootTime, logChange, adjS, adjK, call=True):
     """Return Black's Approximation when volatility is the only variable."""
@@ -10,11 +12,11 @@ def freqVol(vol, rootTime, logChange, adjS, adjK, call=True):
     d2 = d1 - stdDev
 
     if call:
-        cdf_d1, cdf_d2 = norm().cdf(d1), norm().cdf(d2)
+        cdf_d1, cdf_d2 = normCdf(d1), normCdf(d2)
         value = cdf_d1*adjS - cdf_d2*adjK
 
     else: #pricing a put
-        cdf_neg_d2, cdf_neg_d1 = norm().cdf(-d2), norm().cdf(-d1)
+        cdf_neg_d2, cdf_neg_d1 = normCdf(-d2), normCdf(-d1)
         value = cdf_neg_d2*adjK - cdf_neg_d1*adjS
 
     return max(value), stdDev
@@ -26,11 +28,11 @@ def freqVega(h, prA, stdDev, rootTime, logChange, adjS, adjK, call=True):
     d2 = d1 - stdDev
 
     if call:
-        cdf_d1, cdf_d2 = norm().cdf(d1), norm().cdf(d2)
+        cdf_d1, cdf_d2 = normCdf(d1), normCdf(d2)
         value = cdf_d1*adjS - cdf_d2*adjK
 
     else: #pricing a put
-        cdf_neg_d2, cdf_neg_d1 = norm().cdf(-d2), norm().cdf(-d1)
+        cdf_neg_d2, cdf_neg_d1 = normCdf(-d2), normCdf(-d1)
         value = cdf_neg_d2*adjK - cdf_neg_d1*adjS
 
     prB = max(value)
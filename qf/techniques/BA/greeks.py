@@ -1,7 +1,9 @@
 """First order greeks for Black's approximation."""
 
-from scipy.stats import norm
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.normal import normCdf
 
 def firstOrder(h, S, K, r, T, vol, div, dYr, call=True, greek='delta'):
     """Compute first order sensitivites via difference quotiant.
@@ -59,11 +61,11 @@ def firstOrder(h, S, K, r, T, vol, div, dYr, call=True, greek='delta'):
     d2 = d1 - stdDev
 
     if call:
-        cdf_d1, cdf_d2 = norm().cdf(d1), norm().cdf(d2)
+        cdf_d1, cdf_d2 = normCdf(d1), normCdf(d2)
         value = cdf_d1*adjS - cdf_d2*adjK
 
     else:
-        cdf_neg_d2, cdf_neg_d1 = norm().cdf(-d2), norm().cdf(-d1)
+        cdf_neg_d2, cdf_neg_d1 = normCdf(-d2), normCdf(-d1)
         value = cdf_neg_d2*adjK - cdf_neg_d1*adjS
         
     prA, prB = np.amax(value, axis=1)
@@ -1,7 +1,9 @@
 """Implement Black's Approximation."""
 
 import numpy as np
-from scipy.stats import norm
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.normal import normCdf
 
 def blacksApproximation(S, K, r, T, vol, q, dYr, call=True):
     """Price an American option paying discrete dividends.
@@ -45,11 +47,11 @@ def blacksApproximation(S, K, r, T, vol, q, dYr, call=True):
     d2 = d1 - stdDev
 
     if call:
-        cdf_d1, cdf_d2 = norm().cdf(d1), norm().cdf(d2)
+        cdf_d1, cdf_d2 = normCdf(d1), normCdf(d2)
         value = cdf_d1*adjS - cdf_d2*adjK
 
     else:
-        cdf_neg_d2, cdf_neg_d1 = norm().cdf(-d2), norm().cdf(-d1)
+        cdf_neg_d2, cdf_neg_d1 = normCdf(-d2), normCdf(-d1)
         value = cdf_neg_d2*adjK - cdf_neg_d1*adjS
     
     return max(value)
@@ -1,8 +1,10 @@
 """bsjVol"""
 
-from scipy.stats import norm
 from scipy.special import factorial
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.normal import normCdf
 
 def freqVol(vol, sqrtT, logChange, adjS, adjK, call=True):
     """Return the BSM price when volatility is the only variable."""
@@ -11,11 +13,11 @@ def freqVol(vol, sqrtT, logChange, adjS, adjK, call=True):
     d2 = d1 - stdDev
 
     if call:
-        cdf_d1, cdf_d2 = norm().cdf(d1), norm().cdf(d2)
+        cdf_d1, cdf_d2 = normCdf(d1), normCdf(d2)
         value = cdf_d1*adjS - cdf_d2*adjK
 
     else: #pricing a put
-        cdf_neg_d2, cdf_neg_d1 = norm().cdf(-d2), norm().cdf(-d1)
+        cdf_neg_d2, cdf_neg_d1 = normCdf(-d2), normCdf(-d1)
         value = cdf_neg_d2*adjK - cdf_neg_d1*adjS
 
     return value
@@ -1,8 +1,10 @@
 """test models"""
 
-from scipy.stats import norm
 import scipy.integrate
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.normal import normCdf
 
 def BSM(S, K, r, T, vol, q, call=True, delta=False):
     rateTime, divTime = r * T, q * T
@@ -15,12 +17,12 @@ def BSM(S, K, r, T, vol, q, call=True, delta=False):
     d2 = d1 - stdDev
     
     if call:
-        cdf_d1, cdf_d2 = norm().cdf(d1), norm().cdf(d2)
+        cdf_d1, cdf_d2 = normCdf(d1), normCdf(d2)
         value = cdf_d1*adjS - cdf_d2*adjK
         delta_ = cdf_d1
 
     else:
-        cdf_neg_d2, cdf_neg_d1 = norm().cdf(-d2), norm().cdf(-d1)
+        cdf_neg_d2, cdf_neg_d1 = normCdf(-d2), normCdf(-d1)
         value = cdf_neg_d2*adjK - cdf_neg_d1*adjS
         delta_ = -cdf_neg_d1
 
@@ -1,20 +1,21 @@
 
-from scipy.stats import norm
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.normal import normCdf, normPdf
 
 def freqVol(vol, sqrtT, logChange, adjS, adjK, call=True):
-    """Return the BSM price when volatility is the only variable."""
+    """Return the BSM price when volatility is the only variable.
+
+    'call' may be a boolean mask, calls and puts are then priced together.
+    """
     stdDev = vol * sqrtT
     d1 = (logChange)/stdDev + stdDev/2
     d2 = d1 - stdDev
 
-    if call:
-        cdf_d1, cdf_d2 = norm().cdf(d1), norm().cdf(d2)
-        value = cdf_d1*adjS - cdf_d2*adjK
-
-    else: #pricing a put
-        cdf_neg_d2, cdf_neg_d1 = norm().cdf(-d2), norm().cdf(-d1)
-        value = cdf_neg_d2*adjK - cdf_neg_d1*adjS
+    sign = np.where(call, 1., -1.)
+    cdf_d1, cdf_d2 = normCdf(sign*d1), normCdf(sign*d2)
+    value = sign * (cdf_d1*adjS - cdf_d2*adjK)
 
     return value
 
@@ -23,13 +24,134 @@ def freqVega(vol, sqrtT, logChange, adjS):
     stdDev = vol * sqrtT
     d1 = (logChange)/stdDev + stdDev/2
 
-    return adjS * norm().pdf(d1) * sqrtT
+    return adjS * normPdf(d1) * sqrtT
+
+def seedVol(opPr, sqrtT, adjS, adjK, call=True):
+    """Return the Corrado-Miller closed form estimate of implied volatility.
+
+    Parameters
+    ----------
+    opPr  : array_like : Price of contract.
+    sqrtT : array_like : Square root of time, in years, until maturity.
+    adjS  : array_like : Stock price discounted by the dividend rate.
+    adjK  : array_like : Strike price discounted by the risk-free rate.
+    call  : array_like : Boolean mask, True where the row is a call.
+
+    Returns
+    -------
+    volEst : array : Initial guess at volatility.
+
+    Notes
+    -----
+    Puts are mapped to calls by put-call parity. Where the Corrado-Miller
+    discriminant is negative it is floored at zero, which reduces the
+    estimate to the Brenner-Subrahmanyam approximation near the money.
+
+    """
+    fwdGap = adjS - adjK
+    callPr = np.where(call, opPr, opPr + fwdGap)
+    excess = callPr - fwdGap/2
+    discrim = np.maximum(excess**2 - fwdGap**2/np.pi, 0)
+    stdDev = np.sqrt(2*np.pi) / (adjS + adjK) * (excess + np.sqrt(discrim))
+
+    return stdDev / sqrtT
+
+def volChain(opPr, S, K, r, T, q, call=True, volEst=None, eps=10**(-5),
+             maxIts=100, volBounds=(10**(-6), 10), vegaMin=10**(-8)):
+    """Return the BSM implied volatility of every option in a chain.
+
+    All rows are iterated together; rows leave the active set once their
+    price error is below 'eps'. Each row keeps a bracket [lower, upper] on
+    volatility that is tightened every iteration, a Newton-Raphson step is
+    taken when it lands inside the bracket and vega is not negligible,
+    otherwise the row falls back to bisection.
+
+    Parameters
+    ----------
+    opPr      : array_like : Price of contract.
+    S         : array_like : Current price of stock.
+    K         : array_like : Strike price of the option.
+    r         : array_like : Annualized risk-free interest rate, continuously compounded.
+    T         : array_like : Time, in years, until maturity.
+    q         : array_like : Continous dividend rate.
+    call      : array_like : Boolean mask, True where the row is a call.
+    volEst    : array_like : Initial guess at volatility (closed form if None).
+    eps       : float : Accepted error in option price error.
+        (Not the same as error in IV.)
+    maxIts    : int   : Maximum number of iterations function will perfrom.
+    volBounds : tuple : Initial bracket on volatility.
+    vegaMin   : float : Vega below which a bisection step is taken.
+
+    Returns
+    -------
+    vol : array, float : The BSM implied volatility, nan where 'opPr' is
+        outside the no-arbitrage bounds.
+
+    Example(s)
+    ----------
+    >>> volChain([19.55, 1.0645842934501353], [172.37, 100], [175, 90],
+                 [.0463, .08], [1, .5], [.0055, .004], call=[True, False])
+    >>> array([0.25681276, 0.2       ])
+
+    """
+    opPr, S, K, r, T, q, call = np.broadcast_arrays(
+        *map(np.asarray, (opPr, S, K, r, T, q, call)))
+    shape = opPr.shape
+    opPr, S, K, r, T, q, call = (
+        x.ravel() for x in (opPr, S, K, r, T, q, call))
+
+    rateTime, divTime = r * T, q * T
+    adjS, adjK = S * np.exp(-divTime), K * np.exp(-rateTime)
+    sqrtT = np.sqrt(T)
+    logChange = np.log(S/K) + (rateTime - divTime)
+
+    #No-arbitrage bounds, a price outside of them has no implied volatility
+    floor = np.maximum(np.where(call, adjS - adjK, adjK - adjS), 0)
+    cap = np.where(call, adjS, adjK)
+    valid = (floor < opPr) & (opPr < cap)
+
+    lower = np.full(opPr.shape, float(volBounds[0]))
+    upper = np.full(opPr.shape, float(volBounds[1]))
+    if volEst is None:
+        vol = seedVol(opPr, sqrtT, adjS, adjK, call)
+    else:
+        vol = np.broadcast_to(np.asarray(volEst, dtype=float), shape).ravel()
+    vol = np.where(np.isfinite(vol), vol, (lower + upper)/2)
+    vol = np.clip(vol, lower, upper)
+
+    active = np.flatnonzero(valid)
+    for _ in range(maxIts):
+        if active.size == 0:
+            break
+        v = vol[active]
+        prEst = freqVol(v, sqrtT[active], logChange[active],
+                        adjS[active], adjK[active], call[active])
+        error = opPr[active] - prEst
+        done = np.abs(error) < eps
+
+        low = error > 0
+        lower[active] = np.where(low, v, lower[active])
+        upper[active] = np.where(low, upper[active], v)
+        lo, hi = lower[active], upper[active]
 
-def vol(opPr, S, K, r, T, q, call=True, volEst=.1, eps=10**(-5), maxIts=200):
+        vega_ = freqVega(v, sqrtT[active], logChange[active], adjS[active])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            newton = v + error/vega_
+        useNewton = (vega_ > vegaMin) & (lo < newton) & (newton < hi)
+        vol[active] = np.where(done, v, np.where(useNewton, newton, (lo+hi)/2))
+
+        active = active[~done]
+
+    vol[~valid] = np.nan
+    vol = vol.reshape(shape)
+
+    return vol[()] if vol.ndim == 0 else vol
+
+def vol(opPr, S, K, r, T, q, call=True, volEst=None, eps=10**(-5), maxIts=200):
     """Return the BSM implied volatility of an option.
     
-    This functions uses the Newton-Raphson method to iteratively find
-    an approximation of volatility assuming a BSM pricing model.
+    Scalar front end of 'volChain', which safeguards Newton-Raphson
+    with bisection and seeds it with a closed form estimate.
 
     Parameters
     ----------
@@ -41,7 +163,7 @@ def vol(opPr, S, K, r, T, q, call=True, volEst=.1, eps=10**(-5), maxIts=200):
     T     : float : Time, in years, until maturity.
     q     : float : Continous dividend rate.
     call  : bool  : If calculating rho of a call.
-    volEst: float : Initial guess at volatility.
+    volEst: float : Initial guess at volatility (closed form if None).
     eps   : float : Accepted error in option price error.
         (Not the same as error in IV.)
     maxIts: float : Maximum number of iterations function will perfrom.
@@ -53,25 +175,10 @@ def vol(opPr, S, K, r, T, q, call=True, volEst=.1, eps=10**(-5), maxIts=200):
     Example(s)
     ----------
     >>> vol(19.55, 172.37, 175, .0463, 1, .0055)
-    >>> 0.256812757150514
+    >>> 0.2568127571505141
 
     >>> vol(1.0645842934501353, 100, 90, .08, .5, .004, call=False)
-    >>> 0.20000000001801496
+    >>> 0.20000000000000026
     
     """
-    rateTime, divTime = r * T, q * T
-    rateDisc, divDisc = np.exp(-rateTime), np.exp(-divTime)
-    adjS, adjK = S * divDisc, K * rateDisc
-
-    sqrtT = np.sqrt(T)
-    logChange = np.log(S/K) + (rateTime - divTime)
-
-    for _ in range(maxIts):
-        prEst = freqVol(volEst, sqrtT, logChange, adjS, adjK, call)
-        error = opPr - prEst
-        if abs(error) < eps:
-            break
-        vega_ = freqVega(volEst, sqrtT, logChange, adjS)
-        volEst += error / vega_
-    
-    return volEst
+    return volChain(opPr, S, K, r, T, q, call, volEst, eps, maxIts)
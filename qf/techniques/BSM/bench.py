@@ -0,0 +1,41 @@
+"""Time the shared normal CDF/PDF against scipy.stats.norm."""
+
+from scipy.stats import norm
+from timeit import timeit
+import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.normal import normCdf, normPdf
+from price import BSM
+
+def scipyBSM(S, K, r, T, vol, q, call=True):
+    """BSM priced with scipy.stats.norm, as 'BSM' did before."""
+    rateTime, divTime = r * T, q * T
+    adjS, adjK = S * np.exp(-divTime), K * np.exp(-rateTime)
+
+    stdDev = vol * np.sqrt(T)
+    d1 = (np.log(S/K) + rateTime - divTime)/stdDev + stdDev/2
+    d2 = d1 - stdDev
+
+    if call:
+        return norm().cdf(d1)*adjS - norm().cdf(d2)*adjK
+    return norm().cdf(-d2)*adjK - norm().cdf(-d1)*adjS
+
+def compare(name, old, new, number):
+    """Print the mean time per call of two callables and the speedup."""
+    tOld = timeit(old, number=number) / number
+    tNew = timeit(new, number=number) / number
+    print('{:<22}{:>12.2f}us{:>12.2f}us{:>10.1f}x'.format(
+        name, 1e6*tOld, 1e6*tNew, tOld/tNew))
+
+if __name__ == '__main__':
+    x = np.random.default_rng(0).standard_normal(10**5)
+    buf = np.empty_like(x)
+    args = (100, 110, .08, .5, .2, .004)
+
+    print('{:<22}{:>14}{:>14}{:>11}'.format('', 'scipy', 'normal', 'speedup'))
+    compare('cdf, scalar', lambda: norm().cdf(.3), lambda: normCdf(.3), 10**4)
+    compare('pdf, scalar', lambda: norm().pdf(.3), lambda: normPdf(.3), 10**4)
+    compare('cdf, 1e5', lambda: norm().cdf(x), lambda: normCdf(x, out=buf), 100)
+    compare('pdf, 1e5', lambda: norm().pdf(x), lambda: normPdf(x, out=buf), 100)
+    compare('BSM, scalar', lambda: scipyBSM(*args), lambda: BSM(*args), 10**4)
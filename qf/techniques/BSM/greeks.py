@@ -1,7 +1,11 @@
 """BSM< greeks"""
 
-from scipy.stats import norm
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.normal import normCdf, normPdf
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../time')))
+import yearFrac
 
 def delta(S, K, r, T, vol, q, call=True):
     """Return the delta of an option.
@@ -35,7 +39,7 @@ def delta(S, K, r, T, vol, q, call=True):
     logChange = np.log(S/K) + (rateTime - divTime)
     d1 = (logChange)/stdDev + stdDev/2
     
-    cdf_d1 = norm().cdf(d1)
+    cdf_d1 = normCdf(d1)
     if call:
         delta_ = divDisc * cdf_d1
 
@@ -72,7 +76,7 @@ def gamma(S, K, r, T, vol, q):
     logChange = np.log(S/K) + (rateTime - divTime)
     d1 = (logChange)/stdDev + stdDev/2
 
-    return np.exp(-divTime) * norm().pdf(d1) / (S*stdDev)
+    return np.exp(-divTime) * normPdf(d1) / (S*stdDev)
 
 def theta(S, K, r, T, vol, q, call=True, startDate=(), normalize=True):
     """Return the theta of an option.
@@ -92,9 +96,9 @@ def theta(S, K, r, T, vol, q, call=True, startDate=(), normalize=True):
     q   : float : Continous dividend rate.
     call: bool  : If calculating delta of a call.
     
-    startDate : str, tuple : Start date of option.
-        See calander.parseDate for acceptable date inputs
-        EX: 'Dec. 21 2025', '12/21/25', '21 Dec 25', (21, 12, 2025)     
+    startDate : str, tuple, datetime64 : Start date(s) of option.
+        See time/yearFrac.py for acceptable date inputs
+        EX: '2025-12-21', (21, 12, 2025), array of datetime64
     normalize : bool : If theta will be normalized by days in the year.
         
     Returns
@@ -121,22 +125,22 @@ def theta(S, K, r, T, vol, q, call=True, startDate=(), normalize=True):
     d1 = (logChange)/stdDev + stdDev/2
     d2 = d1 - stdDev
     
-    pdf_d1 = norm().pdf(d1)
+    pdf_d1 = normPdf(d1)
     if call:
-        cdf_d1, cdf_d2 = norm().cdf(d1), norm().cdf(d2)
+        cdf_d1, cdf_d2 = normCdf(d1), normCdf(d2)
         theta_ = (- adjS * pdf_d1 * vol/(2 * sqrtT)
                   + q * adjS * cdf_d1
                   - r * adjK * cdf_d2)
         
     else: #theta of a put
-        cdf_neg_d2, cdf_neg_d1 = norm().cdf(-d2), norm().cdf(-d1)
+        cdf_neg_d2, cdf_neg_d1 = normCdf(-d2), normCdf(-d1)
         theta_ = (- adjS * pdf_d1 * vol/(2 * sqrtT)
                   - q * adjS * cdf_neg_d1
                   + r * adjK * cdf_neg_d2)
         
     if normalize:
-        days = calander.trDays(startDate, T) if startDate else 252
-        T_ = T if startDate else 1
+        days = yearFrac.trDays(startDate, T) if np.size(startDate) else 252
+        T_ = T if np.size(startDate) else 1
         theta_ = theta_ * T_ / days  #normalize to calculate theta per day
 
     return theta_
@@ -171,7 +175,7 @@ def vega(S, K, r, T, vol, q):
     logChange = np.log(S/K) + (rateTime - divTime)
     d1 = (logChange)/stdDev + stdDev/2
 
-    return adjS * norm().pdf(d1) * sqrtT
+    return adjS * normPdf(d1) * sqrtT
 
 def rho(S, K, r, T, vol, q, call=True):
     """Return the rho of an option.
@@ -206,9 +210,90 @@ def rho(S, K, r, T, vol, q, call=True):
 
     adjK = K * np.exp(-rateTime)
     if call:
-        rho_ = adjK * T * norm().cdf(d2)
+        rho_ = adjK * T * normCdf(d2)
 
     else: #rho of a put
-        rho_ = -adjK * T * norm().cdf(-d2)
+        rho_ = -adjK * T * normCdf(-d2)
 
     return rho_
+
+def allGreeks(S, K, r, T, vol, q, call=True, startDate=(), normalize=True):
+    """Return the price and the first and second order greeks of options.
+
+    d1, d2, the discount factors and the normal CDF/PDF are evaluated once
+    and shared by every greek. Inputs may be arrays (a chain), they are
+    broadcast against each other.
+
+    Parameters
+    ----------
+    S   : array_like : Current price of stock. (float)
+    K   : array_like : Strike price of the option. (float)
+    r   : array_like : Annualized risk-free interest rate, continuously compounded.
+    T   : array_like : Time, in years, until maturity.
+    vol : array_like : Volatility of the stock.
+    q   : array_like : Continous dividend rate.
+    call: array_like : Boolean mask, True where the row is a call.
+
+    startDate : str, tuple : Start date of option. (See 'theta')
+    normalize : bool : If time sensitivities (theta, charm, veta) are
+        normalized to a per day change.
+
+    Returns
+    -------
+    res : dict : Arrays keyed by 'price', 'delta', 'gamma', 'theta', 'vega',
+        'rho', 'epsilon', 'vanna', 'volga', 'charm', 'veta'.
+
+    Notes
+    -----
+    Sign and scale conventions follow the single greek functions in this
+    file: 'theta', 'charm' and 'veta' are derivatives with respect to
+    calander time (not time to maturity), 'vega' and 'rho' are per unit
+    change. 'epsilon' is the sensitivity to the dividend rate.
+
+    Example(s)
+    ----------
+    >>> res = allGreeks(95, 99, .08, 1, .2, .005)
+    >>> res['delta'], res['gamma'], res['theta']
+    >>> (0.6029303105314465, 0.020151022323663708, -0.028598714481995045)
+
+    """
+    S, K, r, T, vol, q = np.broadcast_arrays(*map(np.asarray, (S, K, r, T, vol, q)))
+    sign = np.where(call, 1., -1.)
+
+    rateTime, divTime = r * T, q * T
+    rateDisc, divDisc = np.exp(-rateTime), np.exp(-divTime)
+    adjS, adjK = S * divDisc, K * rateDisc
+
+    sqrtT = np.sqrt(T)
+    stdDev = vol * sqrtT
+    logChange = np.log(S/K) + (rateTime - divTime)
+    d1 = (logChange)/stdDev + stdDev/2
+    d2 = d1 - stdDev
+
+    pdf_d1 = normPdf(d1)
+    cdf_d1, cdf_d2 = normCdf(sign*d1), normCdf(sign*d2)
+
+    vega_ = adjS * pdf_d1 * sqrtT
+    driftTerm = (2*(r-q)*T - d2*stdDev) / (2*T*stdDev)
+    res = {
+        'price'  : sign * (adjS*cdf_d1 - adjK*cdf_d2),
+        'delta'  : sign * divDisc * cdf_d1,
+        'gamma'  : divDisc * pdf_d1 / (S*stdDev),
+        'theta'  : (- adjS * pdf_d1 * vol/(2 * sqrtT)
+                    + sign * (q*adjS*cdf_d1 - r*adjK*cdf_d2)),
+        'vega'   : vega_,
+        'rho'    : sign * adjK * T * cdf_d2,
+        'epsilon': -sign * adjS * T * cdf_d1,
+        'vanna'  : -divDisc * pdf_d1 * d2 / vol,
+        'volga'  : vega_ * d1 * d2 / vol,
+        'charm'  : divDisc * (sign*q*cdf_d1 - pdf_d1*driftTerm),
+        'veta'   : vega_ * (q + (r-q)*d1/stdDev - (1 + d1*d2)/(2*T))
+        }
+
+    if normalize:
+        days = yearFrac.trDays(startDate, T) if np.size(startDate) else 252
+        T_ = T if np.size(startDate) else 1
+        for grk in ['theta', 'charm', 'veta']:
+            res[grk] = res[grk] * T_ / days  #normalize to per day change
+
+    return res
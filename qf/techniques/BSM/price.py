@@ -1,7 +1,9 @@
 """Implement Black-Scholes-Merton model."""
 
-from scipy.stats import norm
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.normal import normCdf
 
 def BSM(S, K, r, T, vol, q, call=True, delta=False):
     """Price an American option paying discrete dividends.
@@ -40,17 +42,63 @@ def BSM(S, K, r, T, vol, q, call=True, delta=False):
     d2 = d1 - stdDev
     
     if call:
-        cdf_d1, cdf_d2 = norm().cdf(d1), norm().cdf(d2)
+        cdf_d1, cdf_d2 = normCdf(d1), normCdf(d2)
         value = cdf_d1*adjS - cdf_d2*adjK
         delta_ = cdf_d1
 
     else:
-        cdf_neg_d2, cdf_neg_d1 = norm().cdf(-d2), norm().cdf(-d1)
+        cdf_neg_d2, cdf_neg_d1 = normCdf(-d2), normCdf(-d1)
         value = cdf_neg_d2*adjK - cdf_neg_d1*adjS
         delta_ = -cdf_neg_d1
 
     return (value, delta_) if delta else value
 
-r_, q_, T_ = 0, 0, 5
-A = BSM(927.96, 785, .01, 100/252, .23, 0)
-print(A)
+def BSMChain(S, K, r, T, vol, q, call=True):
+    """Price a chain of European options in one broadcasted pass.
+
+    Every input may be a scalar or an array, all inputs are broadcast
+    against each other so a chain with a single spot and rate only needs
+    arrays for the per-row quantities.
+
+    Parameters
+    ----------
+    S    : array_like : Current price of stock.
+    K    : array_like : Strike price of the option.
+    r    : array_like : Annualized risk-free interest rate, continuously compounded.
+    T    : array_like : Time, in years, until maturity.
+    vol  : array_like : Volatility of the stock.
+    q    : array_like : Continous dividend rate.
+    call : array_like : Boolean mask, True where the row is a call.
+
+    Returns
+    -------
+    res : tuple : Array of prices, array of deltas.
+
+    Notes
+    -----
+    Calls and puts share d1 and d2, the put leg is recovered with the sign
+    w = -1 (value = w*(adjS*N(w*d1) - adjK*N(w*d2))) instead of branching
+    on each row. Deltas follow the convention of 'BSM'.
+
+    Example(s)
+    ---------
+    >>> BSMChain(100, [110, 90], .08, .5, .2, .004, call=[True, False])
+    >>> (array([3.31676919, 1.06458429]), array([ 0.36898851, -0.13908873]))
+
+    """
+    S, K, r, T, vol, q = np.broadcast_arrays(*map(np.asarray, (S, K, r, T, vol, q)))
+    sign = np.where(call, 1., -1.)
+
+    rateTime, divTime = r * T, q * T
+    adjS, adjK = S * np.exp(-divTime), K * np.exp(-rateTime)
+
+    stdDev = vol * np.sqrt(T)
+    logChange = np.log(S/K) + (rateTime - divTime)
+    d1 = (logChange)/stdDev + stdDev/2
+    d2 = d1 - stdDev
+
+    cdf_d1, cdf_d2 = normCdf(sign*d1), normCdf(sign*d2)
+    value = sign * (cdf_d1*adjS - cdf_d2*adjK)
+    delta_ = sign * cdf_d1
+
+    return value, delta_
@@ -1,4 +1,5 @@
-from price import BSM
+from price import BSM, BSMChain
+import numpy as np
 
 A = BSM(110, 107, .1, .5, .25, .004, call=False, delta=True)
 print(A)
@@ -14,3 +15,24 @@ print(A)
 
 A = BSM(36, 40, .06, 1, .2, .06, call=False)
 print(A)
+
+"""Chain"""
+K = np.array([107, 110, 110, 90])
+call = np.array([False, True, False, False])
+A = BSMChain(np.array([110, 100, 100, 100]), K, np.array([.1, .08, .08, .08]),
+             .5, np.array([.25, .2, .2, .2]), .004, call)
+print(A)
+
+"""Implied volatility of a chain"""
+from IV import volChain
+
+A = volChain([4.120882545489351, 3.3167691850161702, 1.0645842934501353],
+             [110, 100, 100], [107, 110, 90], [.1, .08, .08], .5, .004,
+             call=[False, True, False])
+print(A)
+#[0.25 0.2 0.2]
+
+from greeks import allGreeks
+A = allGreeks([95, 95], [99, 99], .08, 1, .2, .005, call=[True, False])
+print(A['delta'], A['gamma'], A['vanna'])
+#[ 0.60293031 -0.39208217] [0.02015102 0.02015102] [-0.13167876 -0.13167876]
@@ -0,0 +1,75 @@
+"""Supporting functions for Fourier-cosine (COS) expansion computations."""
+
+import numpy as np
+
+def cumulants(phiRel, h=.01):
+    """Return the first, second and fourth cumulants of a distribution.
+
+    Parameters
+    ----------
+    phiRel : func  : Characteristic function of the (log-return) distribution.
+    h      : float : Step used in the finite differences.
+
+    Returns
+    -------
+    tuple : c1, c2, c4 (floats).
+
+    Notes
+    -----
+    The n-th cumulant is (-i)^n times the n-th derivative of ln(phi) at 0,
+    found by central differences of ln(phi) on the points h*(-3, ..., 3).
+    Only small real arguments are used, so any model with a characteristic
+    function is supported.
+
+    """
+    lnPhi = np.log(phiRel(h * np.arange(-3, 4)))
+    m3, m2, m1, _, p1, p2, p3 = lnPhi
+    
+    d1 = (p1 - m1) / (2*h)
+    d2 = (p1 - 2*lnPhi[3] + m1) / h**2
+    d4 = (-(p3 + m3) + 12*(p2 + m2) - 39*(p1 + m1) + 56*lnPhi[3]) / (6 * h**4)
+    
+    c1, c2, c4 = np.real(-1j*d1), np.real(-d2), np.real(d4)
+    return c1, c2, c4
+
+def truncRange(c1, c2, c4, L=10):
+    """Return the integration range [a, b] from the cumulants.
+
+    The range is c1 -/+ L*sqrt(c2 + sqrt(|c4|)), as in Fang & Oosterlee.
+
+    """
+    width = L * np.sqrt(abs(c2) + np.sqrt(abs(c4)))
+    return c1 - width, c1 + width
+
+def chi(k, a, b, c, d):
+    """Return the cosine series coefficients of exp(y) on [c, d]."""
+    w = k * np.pi / (b-a)
+    cosD, cosC = np.cos(w*(d-a)), np.cos(w*(c-a))
+    sinD, sinC = np.sin(w*(d-a)), np.sin(w*(c-a))
+    res = (cosD*np.exp(d) - cosC*np.exp(c) + w*sinD*np.exp(d) - w*sinC*np.exp(c))
+    return res / (1 + w**2)
+
+def psi(k, a, b, c, d):
+    """Return the cosine series coefficients of 1 on [c, d]."""
+    w = k[1:] * np.pi / (b-a)
+    res = np.empty(len(k))
+    res[0] = d - c
+    res[1:] = (np.sin(w*(d-a)) - np.sin(w*(c-a))) / w
+    return res
+
+def putCoefs(N, a, b):
+    """Return the cosine coefficients of the put payoff (1 - exp(y))^+.
+
+    Parameters
+    ----------
+    N : int   : Number of terms in the expansion.
+    a : float : Lower bound of the range, must be negative.
+    b : float : Upper bound of the range.
+
+    Returns
+    -------
+    res : array : Coefficients U_k, k = 0, ..., N-1, per unit strike.
+
+    """
+    k = np.arange(N)
+    return 2/(b-a) * (psi(k, a, b, a, 0) - chi(k, a, b, a, 0))
@@ -0,0 +1,34 @@
+"""test"""
+
+import numpy as np
+from price import prCOS
+
+def phiBSM(S, r, T, vol, q):
+    halfVar = vol**2 / 2
+    drft = np.log(S) + (r - q - halfVar)*T
+    phi = lambda u: np.exp(1j*u*drft - halfVar*T*u**2)
+
+    return phi
+
+"""COS Price"""
+phi_1 = phiBSM(S=110, r=.1, T=.5, vol=.25, q=.004)
+A = prCOS(phi_1, S=110, K=107, r=.1, T=.5, q=.004, call=False)[0]
+#print(A)
+#4.120882545489388
+
+phi_2 = phiBSM(S=100, r=.08, T=.5, vol=.2, q=.004)
+A, diag = prCOS(phi_2, S=100, K=[90, 110, 110], r=.08, T=.5, q=.004,
+                call=[False, True, False])
+#print(A)
+#array([1.06458429, 3.31676919, 9.20340763])
+
+#print(diag['a'], diag['b'], diag['tail'])
+#-1.4917604962559443 1.5578108321094444 6.877702967940707e-78
+
+"""Short maturity, few terms"""
+phi_3 = phiBSM(S=100, r=.08, T=.05, vol=.2, q=.004)
+A, diag = prCOS(phi_3, S=100, K=np.linspace(60, 160, 5), r=.08, T=.05,
+                q=.004, N=64)
+#print(A, diag["tail"])
+#[ 4.02195226e+01  1.53194216e+01  3.50733541e-02  1.51769619e-07
+# -1.34622908e-08] 2.8799008082336886e-07
@@ -1,7 +1,10 @@
 """Solve for implied volatility when using (inverse) FFT to price an option."""
 
 import numpy as np
+import sys, os
 from price import prFFT
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../helperFuncs')))
+from cache import cachedPhi
 
 def IV(opPr, phiVol, S, K, r, T, q, alpha=1.3, trunc=7, n=10, call=True,
        seed=.15, volEst=.1, ATMeps= .01, IVeps=.0001, maxIts=200):
@@ -30,6 +33,12 @@ def IV(opPr, phiVol, S, K, r, T, q, alpha=1.3, trunc=7, n=10, call=True,
     -------
     volEst : float : Estimated volatility.
 
+    Notes
+    -----
+    Evaluations of 'phiVol' are memoized by (phiVol, vol, grid), see
+    helperFuncs/cache.py, so solving a chain of strikes reuses the grids of
+    the shared starting vols 'seed' and 'volEst'.
+
     Example(s)
     ---------
     >>> WORKS SEE TEST FILE
@@ -39,12 +48,12 @@ def IV(opPr, phiVol, S, K, r, T, q, alpha=1.3, trunc=7, n=10, call=True,
     """
 
     prevVolEst = seed
-    seededPhi = phiVol(prevVolEst)
+    seededPhi = cachedPhi(phiVol, prevVolEst)
     prEst = prFFT(seededPhi, S, K, r, T, q, alpha, trunc, n, call, ATMeps)[0]
     
     for _ in range(maxIts):
         prevPrEst = prEst
-        seededPhi = phiVol(volEst)
+        seededPhi = cachedPhi(phiVol, volEst)
         prEst = prFFT(seededPhi, S, K, r, T, q, alpha, trunc, n, call, ATMeps)[0]
 
         error = opPr - prEst
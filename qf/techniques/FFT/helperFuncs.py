@@ -121,6 +121,18 @@ def genFuncs(phi, S, K, alpha, disc, eps=.01):
         
     return dampener, twiPhi
 
+def simpsonWeights(N):
+    """Return Simpson's rule weights for N equally spaced nodes.
+
+    Weights are (1, 4, 2, 4, ..., 2, 4)/3, the last node is not treated as
+    an end point as the integrand is truncated there.
+
+    """
+    weights = np.full(N, 2/3)
+    weights[1::2] = 4/3
+    weights[0] = 1/3
+    return weights
+
 def phiVol_FT(phiVol, alpha, disc, atmFlag):
     """Transform the multi-input characteristic function by a FT-driven proccess.
 
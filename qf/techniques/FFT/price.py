@@ -1,7 +1,8 @@
 """Implement (inverse) FFT method for pricing an option."""
 
 import numpy as np
-from helperFuncs import genFuncs
+from scipy.interpolate import CubicSpline
+from helperFuncs import genFuncs, simpsonWeights
 
 def prFFT(phi, S, K, r, T, q,
           alpha=1.3, trunc=7, n=10, call=True, ATMeps=.01):
@@ -61,3 +62,70 @@ def prFFT(phi, S, K, r, T, q,
 
     pos_k = 0
     return values[pos_k], values
+
+def prFFTChain(phi, S, K, r, T, q, alpha=1.5, dk=.01, n=12, call=True):
+    """Price options of one maturity at many strikes with a single FFT.
+
+    Parameters
+    ----------
+    phi   : func  : Characteristic function of ln(S_T) (fixed stock-related
+                    paramaters).
+    S     : float : Current price of stock.
+    K     : array : Strike prices of the options.
+    r     : float : Annualized risk-free interest rate, continuously compounded.
+    T     : float : Time, in years, until maturity.
+    q     : float : Continuous dividend rate.
+    alpha : float : Dampening paramater.
+    dk    : float : Spacing of the log-strike grid.
+    n     : int   : Number of grid points is 2**n.
+    call  : bool, array : If pricing call, may be a mask broadcast against K.
+
+    Returns
+    -------
+    values : array : Price of the option at each strike in K.
+
+    Notes
+    -----
+    Carr-Madan: the dampened call price exp(alpha*k)*C(k) is the Fourier
+    transform of psi(v) = disc*phi(v - (alpha+1)i)/(alpha^2 + alpha - v^2
+    + i(2*alpha + 1)v). The log-strike grid k_u = ln(S) + (u - N/2)*dk is
+    centred on the spot, the frequency spacing dv = 2*pi/(N*dk) follows
+    from the FFT, and the integral is weighted with Simpson's rule. Call
+    values at K are read off a cubic spline through the grid, puts are
+    found by put-call parity.
+
+    Example(s)
+    ---------
+    >>> phi = phiBSM(S=100, r=.08, T=.5, vol=.2, q=.004)
+    >>> prFFTChain(phi, S=100, K=[90, 110, 110], r=.08, T=.5, q=.004,
+                   call=[False, True, False])
+    >>> array([1.0645842 , 3.31676956, 9.203408  ])
+
+    """
+    K = np.asarray(K, dtype=float)
+    lnK, disc = np.log(K), np.exp(-r*T)
+    N = 2 ** n
+    dv = 2*np.pi / (N*dk)
+    
+    kStart = np.log(S) - N*dk/2
+    grid = kStart + dk*np.arange(N)
+    if lnK.min() < grid[2] or lnK.max() > grid[-3]:
+        raise ValueError('Strikes lie outside of the log-strike grid, '
+                         'increase dk or n.')
+    
+    V = dv * np.arange(N)
+    denom = alpha**2 + alpha - V**2 + 1j*V*(2*alpha + 1)
+    psi = disc * phi(V - 1j*(alpha+1)) / denom
+    Q = np.exp(-1j*kStart*V) * psi * simpsonWeights(N) * dv
+    
+    callGrid = np.exp(-alpha*grid)/np.pi * np.real(np.fft.fft(Q))
+    
+    lo = max(np.searchsorted(grid, lnK.min()) - 4, 0)
+    hi = min(np.searchsorted(grid, lnK.max()) + 4, N)
+    values = CubicSpline(grid[lo:hi], callGrid[lo:hi])(lnK)
+    
+    put = np.logical_not(call)
+    values = values + put * (K*disc - S*np.exp(-q*T)) #put-call parity
+    
+    return values
+
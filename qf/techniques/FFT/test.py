@@ -1,7 +1,7 @@
 """test"""
 
 import numpy as np
-from price import prFFT
+from price import prFFT, prFFTChain
 from testModels import *
 
 """Control group"""
@@ -43,6 +43,13 @@ A = prFFT(phi_2, S=100, K=90, r=.08, T=.5, q=.004, call=False)
 # array([ 1.06540414,  3.54253946,  5.7179566 , ..., -6.73580893,
 #       -4.25734426, -1.59219072]))
 
+"""FFT Chain"""
+phi_2 = phiBSM(S=100, r=.08, T=.5, vol=.2, q=.004)
+A = prFFTChain(phi_2, S=100, K=[90, 110, 110], r=.08, T=.5, q=.004,
+               call=[False, True, False])
+#print(A)
+#array([1.0645842 , 3.31676956, 9.203408  ])
+
 """FFT IV"""
 from IV import IV
 
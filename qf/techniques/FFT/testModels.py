@@ -1,5 +1,7 @@
 """Test Models"""
 
+import numpy as np
+
 def phiBSM(S, r, T, vol, q):
     halfVar = vol**2 / 2
     drft = np.log(S) + (r - q - halfVar)*T
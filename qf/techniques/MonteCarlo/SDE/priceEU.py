@@ -23,20 +23,25 @@ path == False:
         
 """
 
-def priceEU(dX, K, r, T, sims=10**5, steps=100 call=True):
-    """Price Euro option via MC on SP."""
-    vals = dX.discretize(sims=sims, steps=steps, path=False)[0]
+def sampleEU(sims, rng, dX, K, r, T, steps=100, call=True):
+    """Return discounted payoffs of a Euro option. (Sampler, see executor)"""
+    vals = dX.discretize(sims=sims, steps=steps, path=False, rng=rng)[0]
     payOff = np.maximum(vals-K, 0) if call else np.maximum(K-vals, 0)
-    return np.exp(-r*T) * np.mean(payOff)
+    return np.exp(-r*T) * payOff
+
+def priceEU(dX, K, r, T, sims=10**5, steps=100, call=True, rng=np.random):
+    """Price Euro option via MC on SP."""
+    return np.mean(sampleEU(sims, rng, dX, K, r, T, steps, call))
     
-def priceAM(SP, K, r, T, sims=10000, steps=100, degree=5, call=True):
+def priceAM(dX, K, r, T, sims=10000, steps=100, degree=5, call=True,
+            rng=np.random):
     """Longstaff and Schwartz"""
     dT = T/steps
     disc = np.exp(-r*dT)
-    P = dX.discretize(sims=sims, steps=steps+, path=False)[0]
+    P = dX.discretize(sims=sims, steps=steps, path=True, rng=rng)[0]
 
     #generate payoffs
-    payOff = np.maximum(vals-K, 0) if call else np.maximum(K-vals, 0)
+    opVals = np.maximum(P-K, 0) if call else np.maximum(K-P, 0)
 
     for i in np.arange(steps-1, 0, -1):
         leastSq = np.polyfit(P[i], opVals[i+1]*disc, degree)
@@ -8,14 +8,15 @@ class X:
         self.S = S
         self.drift = r - q - (v**2)/2
         self.diff = v
-    def sample(self, sims, idx, mag=0):
-        A = self.diff*np.sqrt(idx)*np.random.normal(size=sims)
+    def sample(self, sims, idx, mag=0, rng=np.random):
+        A = self.diff*np.sqrt(idx)*rng.normal(size=sims)
         if mag == 0:
             return self.S * np.exp(self.drift*idx + A)
         else:
             return mag * np.exp(self.drift*idx + A)
 
-def priceAM(SP, K, r, T, sims=10000, steps=100, degree=5, call=True):
+def priceAM(SP, K, r, T, sims=10000, steps=100, degree=5, call=True,
+            rng=np.random):
     """Longstaff and Schwartz"""
     dT = T/steps
     disc = np.exp(-r*dT)
@@ -23,7 +24,7 @@ def priceAM(SP, K, r, T, sims=10000, steps=100, degree=5, call=True):
     P = np.zeros((steps+1, sims), dtype=np.float64)
     P[0] = SP.S
     for i in np.arange(1, steps+1):
-        P[i] = P[i-1] * SP.sample(sims, dT, mag=1)
+        P[i] = P[i-1] * SP.sample(sims, dT, mag=1, rng=rng)
 
     #generate payoffs
     opVals = np.maximum(P - K, 0) if call else np.maximum(K - P, 0)
@@ -35,8 +36,79 @@ def priceAM(SP, K, r, T, sims=10000, steps=100, degree=5, call=True):
         opVals[i] = opVals[i]*boolEx + opVals[i+1]*disc*(np.invert(boolEx))
 
     return disc * np.mean(opVals[1])
-S, K, T = 36, 40, 1
-r, q, v = .06, .06, .2
-SP = X(S, r, q, v)
-A = priceAM(SP, K, r, T, call=False)
-#print(A)
+
+def sampleAM(sims, rng, SP, K, r, T, steps=100, degree=5, call=True):
+    """Return LSM discounted cash flows per path. (Sampler, see executor)
+
+    The regression is fit on these 'sims' paths only, see 'priceAMStream'.
+
+    """
+    dT = T/steps
+    disc = np.exp(-r*dT)
+    sign = 1 if call else -1
+
+    W = rng.standard_normal(sims)
+    W *= np.sqrt(T)
+    S_t = SP.S * np.exp(SP.drift*T + SP.diff*W)
+    cashFlow = np.maximum(sign*(S_t - K), 0)
+
+    for i in np.arange(steps-1, 0, -1):
+        t = i*dT
+        noise = rng.standard_normal(sims)
+        W *= t/(t+dT)
+        W += np.sqrt(t*dT/(t+dT)) * noise
+        np.exp(SP.drift*t + SP.diff*W, out=S_t)
+        S_t *= SP.S
+        
+        cashFlow *= disc
+        leastSq = np.polyfit(S_t, cashFlow, degree)
+        contVal = np.polyval(leastSq, S_t)
+        exVal = np.maximum(sign*(S_t - K), 0)
+        boolEx = (exVal > contVal)
+        cashFlow[boolEx] = exVal[boolEx]
+
+    cashFlow *= disc
+    return cashFlow
+
+def priceAMStream(SP, K, r, T, sims=10000, steps=100, degree=5, call=True,
+                  seed=None):
+    """Longstaff and Schwartz, simulating paths backwards in time.
+
+    Same estimator as 'priceAM' (regression at every exercise date), but
+    the paths are generated from expiry back to the start with a Brownian
+    bridge, so only the current prices and cash flows (O(sims) memory) are
+    held rather than (steps+1, sims) matrices.
+
+    Parameters
+    ----------
+    SP     : obj   : Geometric BM, with attributes S, drift and diff for
+                     S_t = S * exp(drift*t + diff*W_t).
+    K      : float : Strike price of the option.
+    r      : float : Annualized risk-free interest rate, continuously compounded.
+    T      : float : Time, in years, until maturity.
+    sims   : int   : Number of paths.
+    steps  : int   : Number of exercise dates.
+    degree : int   : Degree of the regression polynomial.
+    call   : bool  : If pricing call.
+    seed   : int, optional : Seed of the generator drawing the paths.
+
+    Returns
+    -------
+    float : Price of the option.
+
+    Notes
+    -----
+    Given W at t + dT, W at t is N(W_{t+dT} * t/(t+dT), t*dT/(t+dT)), so
+    W_T is drawn first and each earlier date is drawn conditionally on the
+    next one, in the order the LSM regression needs them.
+
+    """
+    rng = np.random.default_rng(seed)
+    return np.mean(sampleAM(sims, rng, SP, K, r, T, steps, degree, call))
+
+if __name__ == "__main__":
+    S, K, T = 36, 40, 1
+    r, q, v = .06, .06, .2
+    SP = X(S, r, q, v)
+    A = priceAM(SP, K, r, T, call=False)
+    #print(A)
@@ -4,12 +4,127 @@ import numpy as np
 
 def rationalPricing(vals, asset=True):
     """val = np.array"""
-    return np.array([x for i, x in enumerate(vals) if x>0])
+    return vals[vals > 0]
 
-def priceEU(S_t, K, r, T, sims=50000, call=True):
-    """Price Euro option via MC on SP."""
+def sampleEU(sims, rng, S_t, K, r, T, call=True):
+    """Return discounted payoffs of a Euro option. (Sampler, see executor)"""
     disc = np.exp(-r*T)
-    S_T = rationalPricing(S_t.sample(sims, T))
+    S_T = rationalPricing(S_t.sample(sims, T, rng=rng))
     opVals = np.maximum(S_T - K, 0) if call else np.maximum(K - S_T, 0)
 
-    return disc * np.mean(opVals)
+    return disc * opVals
+
+def priceEU(S_t, K, r, T, sims=50000, call=True, rng=np.random):
+    """Price Euro option via MC on SP."""
+    return np.mean(sampleEU(sims, rng, S_t, K, r, T, call))
+
+def priceEUVR(SP, K, r, T, sims=50000, call=True, methods=('antithetic',),
+              q=None, rng=np.random):
+    """Price Euro option via MC on SP, with variance reduction.
+
+    Parameters
+    ----------
+    SP      : obj   : Stochastic process with attribute S and method
+                      sample(sims, T, rng=rng). If SP is a geometric BM, with
+                      attributes drift and diff for
+                      S_t = S * exp(drift*t + diff*W_t), the paths are built
+                      from normal draws and every method is available.
+    K       : float : Strike price of the option.
+    r       : float : Annualized risk-free interest rate, continuously compounded.
+    T       : float : Time, in years, until maturity.
+    sims    : int   : Number of paths.
+    call    : bool  : If pricing call.
+    methods : tuple : Any of 'antithetic', 'moment', 'control', 'importance'.
+    q       : float, optional : Continuous dividend rate, only used by the
+                      control of an SP that is not a geometric BM.
+    rng     : Generator : Source of the draws, defaults to np.random.
+
+    Returns
+    -------
+    tuple : Price, standard error, gain.
+
+        gain is the ratio of the crude MC variance per path to the variance
+        per path of the estimator, so crude MC needs 'gain' times as many
+        paths for the same confidence interval.
+
+    Notes
+    -----
+    antithetic : Paths come in pairs driven by Z and -Z.
+    moment     : The normal draws are rescaled to have sample mean 0 and
+                 variance 1.
+    control    : The discounted S_T of the same paths, its mean is the
+                 discounted forward: disc*S*exp((drift + diff**2/2)*T)
+                 for a geometric BM, else S*exp(-q*T) with q required.
+                 The coefficient is the sample regression coefficient (on
+                 the antithetic pair means, if paired). A BSM payoff
+                 control ('BSM' as the known mean) is not offered: on a
+                 geometric BM SP it is the payoff itself (beta = 1, no
+                 information), and other SPs share no normals with it.
+    importance : The draws are shifted so the median path ends at the
+                 strike and reweighted by the likelihood ratio, for deep
+                 OTM strikes.
+
+    'antithetic', 'moment' and 'importance' act on the normal draws, so
+    they need a geometric BM SP.
+
+    Example(s)
+    ---------
+    >>> priceEUVR(SP, 40, .06, 1, 10000, False, ('antithetic', 'control'),
+                  rng=np.random.default_rng(1))
+    >>> (5.113056637921117, 0.004575524668409927, 107.47486178976692)
+
+    """
+    disc = np.exp(-r*T)
+    sign = 1 if call else -1
+    payOff = lambda S_T: disc * np.maximum(sign*(S_T - K), 0)
+    weight = 1
+    
+    if not hasattr(SP, 'diff'):
+        normals = sorted({'antithetic', 'moment', 'importance'} & set(methods))
+        if normals:
+            raise ValueError(f'{normals} need a geometric BM SP '
+                             '(attributes S, drift and diff).')
+        S_T = SP.sample(sims, T, rng=rng)
+        crude = payOff(S_T)
+        
+    else:
+        rootT = np.sqrt(T)
+        antithetic = 'antithetic' in methods
+        Z = rng.standard_normal(sims//2 if antithetic else sims)
+        crude = payOff(SP.S * np.exp(SP.drift*T + SP.diff*rootT*Z))
+        
+        if 'moment' in methods:
+            Z = Z - (0 if antithetic else Z.mean())
+            Z = Z / np.sqrt(np.mean(Z**2)) #std of Z, or of (Z, -Z) if paired
+        if antithetic:
+            Z = np.concatenate((Z, -Z))
+        if 'importance' in methods:
+            mu = (np.log(K/SP.S) - SP.drift*T) / (SP.diff*rootT)
+            Z += mu
+            weight = np.exp(-mu*Z + mu**2/2)
+        S_T = SP.S * np.exp(SP.drift*T + SP.diff*rootT*Z)
+
+    Y = weight * payOff(S_T)
+    if hasattr(SP, 'diff'):
+        forward = disc * SP.S * np.exp((SP.drift + SP.diff**2/2)*T)
+    elif q is not None:
+        forward = SP.S * np.exp(-q*T)
+    elif 'control' in methods:
+        raise ValueError('The control of an SP that is not a geometric BM '
+                         'needs its dividend rate q.')
+    else:
+        forward = 0
+    C = weight*disc*S_T - forward
+    if 'antithetic' in methods:
+        Y = (Y[:len(Y)//2] + Y[len(Y)//2:]) / 2
+        C = (C[:len(C)//2] + C[len(C)//2:]) / 2
+        
+    if 'control' in methods:
+        dC = C - C.mean()
+        beta = np.dot(Y - Y.mean(), dC) / np.dot(dC, dC) if np.any(dC) else 0
+        Y = Y - beta*C
+    
+    varPath = np.var(Y, ddof=1) * (2 if 'antithetic' in methods else 1)
+    gain = np.var(crude, ddof=1) / varPath if varPath > 0 else np.inf
+    
+    return np.mean(Y), np.sqrt(np.var(Y, ddof=1) / len(Y)), gain
@@ -10,8 +10,8 @@ class X:
         self.drift = r - q - (v**2)/2
         self.diff = v
 
-    def sample(self, sims, idx, mag=0):
-        A = self.diff*np.sqrt(idx)*np.random.normal(size=sims)
+    def sample(self, sims, idx, mag=0, rng=np.random):
+        A = self.diff*np.sqrt(idx)*rng.normal(size=sims)
         if mag == 0:
             return self.S * np.exp(self.drift*idx + A)
         else:
@@ -28,6 +28,43 @@ print(A)
 A = priceAM(S_t, K, r, T, call=False)
 print(A)
 
+A = priceAMStream(S_t, K, r, T, call=False, seed=1)
+print(A)
+
 #BSM price is 5.1190960266969086
 #EU MC price is 5.117882848131343
 #AM MC price is 5.165913353020875
+#AM MC price, streamed, is 5.219823418373884
+
+"""Variance reduction"""
+rng = np.random.default_rng(1)
+for methods in [(), ('antithetic',), ('antithetic', 'moment'), ('control',),
+                ('antithetic', 'control')]:
+    print(methods, priceEUVR(S_t, K, r, T, 10000, False, methods, q=q, rng=rng))
+
+A = priceEUVR(S_t, 60, r, T, 10000, True, ('importance',),
+              rng=np.random.default_rng(1))
+print(A)
+#BSM price is 0.01475470701711748
+#(0.014713340616233788, 0.00018131237953257284, 470.40991507374713)
+
+"""Parallel, reproducible"""
+import sys
+sys.path.append('../')
+from executor import runMC
+
+if __name__ == '__main__':
+    A = runMC(sampleEU, 10**6, S_t, K, r, T, False, seed=7, workers=4)
+    print(A)
+    #(5.114492779823566, 0.004740808264603694), for any # of workers
+
+"""Randomized QMC, error ~ O(1/N)"""
+sys.path.append('../../../stochastic/StochProc')
+from QMC import rqmc
+
+for sims in [2**10, 2**12, 2**14]:
+    A = rqmc(sampleEU, sims, S_t, K, r, T, False, seed=7)
+    print(A)
+#(5.11901375842209, 0.00028261119274456)
+#(5.119157535142104, 5.0297286428317353e-05)
+#(5.119080619370234, 5.841381142251474e-06)
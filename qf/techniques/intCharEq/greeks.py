@@ -2,8 +2,12 @@
 
 import numpy as np
 import scipy.integrate
+import sys, os
+from price import integratePhi, integratePhiGL
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../helperFuncs')))
+from cache import cachedPhi
 
-def delta(phi, S, K, r, T, q, call=True):
+def delta(phi, S, K, r, T, q, call=True, deg=None, scale=1):
     """Calculate delta via direct integration of phi.
 
     Parameters
@@ -14,7 +18,10 @@ def delta(phi, S, K, r, T, q, call=True):
     r    : float : Annualized risk-free interest rate, continuously compounded.
     T    : float : Time, in years, until maturity.
     q    : float : Continuous dividend rate.
-    call : bool  : If pricing call.
+    call : bool  : If pricing call, may be a mask broadcast against K.
+    deg  : int, optional : Number of Gauss-Laguerre nodes, if given the
+        integral is found on a fixed grid for all K at once.
+    scale: float : Nodes are scaled by this factor. (Gauss-Laguerre only)
 
     Returns
     -------
@@ -22,87 +29,77 @@ def delta(phi, S, K, r, T, q, call=True):
 
     Example(s)
     ---------
-    >>>
-    >>>
-    >>>
+    >>> delta(phi_2, S=100, K=[90, 110], r=.08, T=.5, q=.004,
+              call=[False, True], deg=64)
+    >>> array([-0.13908873,  0.36898851])
     
     """
+    if deg is not None:
+        return integratePhiGL(phi, S, K, r, T, q, call, deg, scale)[1]
+    
     twPhi = lambda u: phi(u-1j) / phi(-1j)
 
     k = np.log(K)
-    trfPhi = lambda u: np.imag(np.exp(-1j*u*k) * phi(u)) / u
     trfTwi = lambda u: np.imag(np.exp(-1j*u*k) * twPhi(u)) / u
     
     B = scipy.integrate.quad(trfTwi, 0, np.inf)[0]
-    delta_ = .5 + B/np.pi
+    delta_ = .5 + B/np.pi - np.logical_not(call)
 
     return delta_
 
-def firstOrder(h, genPhi, S, K, r, T, q, call=True, greek='delta'):
+def firstOrder(h, genPhi, S, K, r, T, q, call=True, greek='delta',
+               deg=None, scale=1):
     """Calculate first order greeks via direct integration of phi.
 
     Parameters
     ----------
     h    : float : Change in input.
-    genPhi : func  : Characteristic function (fixed stock-related paramaters).
+    genPhi : func  : genPhi(r, T, q) returns the characteristic function
+        (other stock-related paramaters fixed).
     S    : float : Current price of stock.
     K    : float : Strike price of the option.
     r    : float : Annualized risk-free interest rate, continuously compounded.
     T    : float : Time, in years, until maturity.
     q    : float : Continuous dividend rate.
     call : bool  : If pricing call.
-    greek: str   : Greek to be calculated.
+    greek: str   : 'delta', 'theta', 'rho' or 'div'.
+    deg  : int, optional : Number of Gauss-Laguerre nodes. (See 'delta')
+    scale: float : Nodes are scaled by this factor. (Gauss-Laguerre only)
 
     Returns
     -------
     grk : First order greek.
 
+    Notes
+    -----
+    Theta, rho and div are central differences of the price in T, r and q,
+    theta is per year of decay: (V(T-h) - V(T+h)) / 2h. Each price comes
+    from 'integratePhi', with deg given all of K is priced on one fixed
+    Gauss-Laguerre grid per bump and the grid evaluations are memoized
+    (helperFuncs.cache), so repeated greeks of a model reuse the bumps.
+
     Example(s)
     ---------
-    >>>
-    >>>
-    >>>
+    >>> genPhi = lambda r, T, q: phiBSM(100, r, T, .2, q)
+    >>> firstOrder(1e-4, genPhi, 100, [90, 110], .08, .5, .004,
+                   greek='rho', deg=64)
+    >>> array([35.76269069, 16.75417911])
     
     """
-
     if greek == 'delta':
-        return delta(phi, S, K, r, T, q, call)
-    
-    phi_ = genPhi(greek)
-    twPhi = lambda u: phi_(u-1j) / phi_(-1j)
-
-    k = np.log(K)
-    trfPhi = lambda u: np.imag(np.exp(-1j*u*k) * phi_(u)) / u
-    trfTwi = lambda u: np.imag(np.exp(-1j*u*k) * twPhi(u)) / u
-
-    facS, facK = 1, 1
-    if greek == 'theta':
-        tmp = np.exp(-h*T) - np.exp(h*T)
-        facS, facK = tmp, tmp
-        F = np.exp(-h*T) * trfTwi_Pos - np.exp(h*T) * trfTwi_Neg
-        G = np.exp(-h*T) * phi_Pos - np.exp(h*T) * phi_Neg
-    elif greek == 'rho':
-        facK = np.exp(-h*r) - np.exp(h*r)
-        F = trfTwi
-        G = np.exp(-h*r) * phi_Pos - np.exp(h*r) * phi_Neg
-    elif greek == 'div':
-        facS = np.exp(-h*q) - np.exp(h*q)
-        F = np.exp(-h*q) * trfTwi_Pos - np.exp(h*q) * trfTwi_Neg
-        G = trfPhi
-    
-    A = scipy.integrate.quad(G, 0, np.inf)[0]
-    B = scipy.integrate.quad(F, 0, np.inf)[0]
-
-    intK = A/np.pi
-    intS = B/np.pi
+        return delta(cachedPhi(genPhi, r, T, q), S, K, r, T, q, call, deg, scale)
 
-    adjS, adjK = S*np.exp(-q*T), K*np.exp(-r*T)
-    if call:            
-        prDiff = facS*adjS/2 + adjS*intS - adjK*intK - facK*adjK/2
+    bump = {'theta': (0, -h, 0), 'rho': (h, 0, 0), 'div': (0, 0, h)}[greek]
+    up = [x + dx for x, dx in zip((r, T, q), bump)]
+    down = [x - dx for x, dx in zip((r, T, q), bump)]
 
-    else: #pricing a put #NEEDS TO GET DONE
-        pITM, delta = 1 - delta, 1 - pITM
-        prDiff = adjK*delta - adjS*pITM                    
+    if deg is None:
+        price = lambda r_, T_, q_: integratePhi(genPhi(r_, T_, q_), S, K,
+                                                r_, T_, q_, call)[0]
+    else:
+        K = np.asarray(K, dtype=float)
+        price = lambda r_, T_, q_: integratePhiGL(cachedPhi(genPhi, r_, T_, q_), S, K,
+                                                  r_, T_, q_, call, deg, scale)[0]
 
-    grk = prDiff / (2*h)
+    grk = (price(*up) - price(*down)) / (2*h)
     return grk
@@ -2,8 +2,9 @@
 
 import numpy as np
 import scipy.integrate
+from numpy.polynomial.laguerre import laggauss
 
-def integratePhi(phi, S, K, r, T, q, call=True):
+def integratePhi(phi, S, K, r, T, q, call=True, deg=None, scale=1):
     """Price an option by calculating the delta and Pr(S_T > K).
 
     Parameters
@@ -15,6 +16,10 @@ def integratePhi(phi, S, K, r, T, q, call=True):
     T    : float : Time, in years, until maturity.
     q    : float : Continuous dividend rate.
     call : bool  : If pricing call.
+    deg  : int, optional : Number of Gauss-Laguerre nodes. If given, the
+        integrals are found on a fixed grid (see 'integratePhiGL') instead
+        of by adaptive quadrature.
+    scale: float : Nodes are scaled by this factor. (Gauss-Laguerre only)
 
     Returns
     -------
@@ -44,6 +49,9 @@ def integratePhi(phi, S, K, r, T, q, call=True):
     >>> (1.064584293450137, -0.13908873256331966)
     
     """
+    if deg is not None:
+        return integratePhiGL(phi, S, K, r, T, q, call, deg, scale)
+    
     twPhi = lambda u: phi(u-1j) / phi(-1j)
 
     k = np.log(K)
@@ -66,3 +74,108 @@ def integratePhi(phi, S, K, r, T, q, call=True):
         delta = deltaCall - 1
 
     return pr, delta
+
+def laguerreGrid(deg, scale=1):
+    """Return Gauss-Laguerre nodes and weights for integrals over [0, inf).
+
+    The weights absorb the exp(-x) weight function and the scaling of the
+    nodes: int_0^inf f(u) du ~ sum(weights * f(nodes)). Valid for
+    deg <= 180 (exp(x) overflows for larger nodes).
+
+    """
+    X, W = laggauss(deg)
+    return scale * X, scale * W * np.exp(X)
+
+def integralsGL(phi, K, deg=64, scale=1):
+    """Return the integrals giving Pr(S_T > K) and delta, for all K at once.
+
+    Parameters
+    ----------
+    phi   : func  : Characteristic function (fixed stock-related paramaters).
+    K     : array : Strike prices.
+    deg   : int   : Number of Gauss-Laguerre nodes.
+    scale : float : Nodes are scaled by this factor.
+
+    Returns
+    -------
+    tuple : int_0^inf Im(exp(-iuk)*f(u))/u du for f = phi and the twisted
+        phi(u-i)/phi(-i), arrays over K.
+
+    """
+    U, W = laguerreGrid(deg, scale)
+    
+    F = np.empty((deg, 2), dtype=complex)
+    F[:, 0] = phi(U)
+    F[:, 1] = phi(U-1j) / phi(-1j)
+    F *= (W/U)[:, None]
+
+    k = np.log(K)
+    res = np.imag(np.exp(-1j*np.multiply.outer(k, U)) @ F)
+    return res[..., 0], res[..., 1]
+
+def integratePhiGL(phi, S, K, r, T, q, call=True, deg=64, scale=1):
+    """Price options by direct integration on a fixed Gauss-Laguerre grid.
+
+    Parameters
+    ----------
+    phi   : func  : Characteristic function (fixed stock-related paramaters).
+    S     : float : Current price of stock.
+    K     : float, array : Strike price(s) of the option(s).
+    r     : float : Annualized risk-free interest rate, continuously compounded.
+    T     : float : Time, in years, until maturity.
+    q     : float : Continuous dividend rate.
+    call  : bool, array : If pricing call, may be a mask broadcast against K.
+    deg   : int   : Number of Gauss-Laguerre nodes.
+    scale : float : Nodes are scaled by this factor, decrease it for long
+        maturities and increase it for short ones.
+
+    Returns
+    -------
+    tuple : Price(s) of option(s), Delta(s) of option(s)
+
+    Notes
+    -----
+    The characteristic function is evaluated once on the 'deg' nodes and
+    the integrals for every strike come from one (strikes x deg) matrix
+    product, against two adaptive 'quad' calls per strike. See 'errorGL'
+    for the difference from the adaptive path.
+
+    Example(s)
+    ---------
+    >>> phi_2 = phiBSM(S=100, r=.08, T=.5, vol=.2, q=.004)
+    >>> integratePhiGL(phi_2, S=100, K=[110, 110, 90], r=.08, T=.5, q=.004,
+                       call=[True, False, False])
+    >>> (array([3.31676919, 9.20340763, 1.06458429]),
+         array([ 0.36898851, -0.63101149, -0.13908873]))
+    
+    """
+    K = np.asarray(K, dtype=float)
+    A, B = integralsGL(phi, K, deg, scale)
+    pITMCall = .5 + A/np.pi
+    deltaCall = .5 + B/np.pi
+
+    adjS, adjK = S*np.exp(-q*T), K*np.exp(-r*T)
+    put = np.logical_not(call)
+    pr = adjS*deltaCall - adjK*pITMCall + put*(adjK - adjS) #put-call parity
+    delta = deltaCall - put
+
+    return pr, delta
+
+def errorGL(phi, S, K, r, T, q, call=True, deg=64, scale=1):
+    """Return the absolute price error of 'integratePhiGL' vs 'integratePhi'.
+
+    Parameters are as in 'integratePhiGL'. The adaptive path is run for
+    each strike, use this to choose 'deg' and 'scale' for a chain.
+
+    Example(s)
+    ---------
+    >>> errorGL(phi_2, S=100, K=[90, 110], r=.08, T=.5, q=.004, deg=32)
+    >>> array([2.27373675e-13, 1.13686838e-13])
+    
+    """
+    K = np.atleast_1d(np.asarray(K, dtype=float))
+    call = np.broadcast_to(call, K.shape)
+    prGL = integratePhiGL(phi, S, K, r, T, q, call, deg, scale)[0]
+    prQuad = [integratePhi(phi, S, k, r, T, q, c)[0] for k, c in zip(K, call)]
+    
+    return np.abs(prGL - prQuad)
@@ -1,4 +1,5 @@
-from price import integratePhi
+import numpy as np
+from price import integratePhi, integratePhiGL, errorGL
 from testModels import phiBSM, BSM
 
 phi_1 = phiBSM(S=110, r=.1, T=.5, vol=.25, q=.004)
@@ -21,6 +22,32 @@ A = integratePhi(phi_2, S=100, K=90, r=.08, T=.5, q=.004, call=False)
 #print(A)
 (1.064584293450137, -0.13908873256331966)
 
+"""Gauss-Laguerre, all strikes at once"""
+A = integratePhiGL(phi_2, S=100, K=[110, 110, 90], r=.08, T=.5, q=.004,
+                   call=[True, False, False])
+#print(A)
+#(array([3.31676919, 9.20340763, 1.06458429]),
+# array([ 0.36898851, -0.63101149, -0.13908873]))
+
+A = errorGL(phi_2, S=100, K=[90, 110], r=.08, T=.5, q=.004, deg=32)
+#print(A)
+#array([2.27373675e-13, 1.13686838e-13])
+
+"""Greeks, Gauss-Laguerre vs BSM"""
+from greeks import delta, firstOrder
+
+A = delta(phi_2, S=100, K=[90, 110], r=.08, T=.5, q=.004,
+          call=[False, True], deg=64)
+B = [BSM(100, 90, .08, .5, .2, .004, call=False, delta=True)[1],
+     BSM(100, 110, .08, .5, .2, .004, delta=True)[1]]
+print(np.allclose(A, B))
+#True
+
+genPhi = lambda r, T, q: phiBSM(100, r, T, .2, q)
+A = firstOrder(1e-4, genPhi, 100, [90, 110], .08, .5, .004, greek='rho', deg=64)
+#print(A)
+#array([35.76269069, 16.75417911])
+
 """Control group"""
 A = BSM(110, 107, .1, .5, .25, .004, call=False, delta=True)
 print(A)
@@ -0,0 +1,39 @@
+"""Time Richardson extrapolated lattices against depth 5000 (American)."""
+
+import numpy as np
+from time import perf_counter
+from priceAM import priceAM
+
+def priceJumps(vol, dT):
+    up = np.exp(vol * np.sqrt(dT))
+    return up
+
+def probJumps(r, q, dT, priceUp):
+    priceDown = 1/priceUp
+    up = (np.exp((r-q)*dT) - priceDown) / (priceUp - priceDown)
+    return up
+
+def timed(func, *args, **kwargs):
+    """Return the output of func and its run time in seconds."""
+    start = perf_counter()
+    res = func(*args, **kwargs)
+    return res, perf_counter() - start
+
+if __name__ == '__main__':
+    S, r, T, vol, q = 100, .08, .5, .25, .02
+    priUp = lambda dT: priceJumps(vol, dT)
+    proUp = lambda dT: probJumps(r, q, dT, priceJumps(vol, dT))
+    
+    print('{:<10}{:>12}{:>20}{:>20}{:>20}'.format(
+        'option', 'reference', 'depth 5000', 'extrap=2, 200', 'extrap=3, 200'))
+    for K, call in [(90, False), (100, False), (110, False), (100, True)]:
+        ref = priceAM(S, K, r, T, priUp, proUp, 16000, call,
+                      extrap=3, smooth=(vol, q))
+        row = [timed(priceAM, S, K, r, T, priUp(T/5000), proUp(T/5000),
+                     5000, call)]
+        for order in [2, 3]:
+            row.append(timed(priceAM, S, K, r, T, priUp, proUp, 200, call,
+                             extrap=order, smooth=(vol, q)))
+            
+        res = ''.join('{:>11.2e} ({:.4f}s)'.format(pr - ref, t) for pr, t in row)
+        print('{:<10}{:>12.6f}{}'.format(('C' if call else 'P') + str(K), ref, res))
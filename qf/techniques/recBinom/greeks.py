@@ -1,4 +1,8 @@
 import numpy as np
+from priceChain import priceChain
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../time')))
+import yearFrac
 
 def delta(S, K, r, T, vol, q, exerciseTimes=[],
                startDate=(), eps=10**-4, call=True, N=5000):
@@ -109,8 +113,8 @@ def theta(S, K, r, T, vol, q, exerciseTimes=[],
     dT = T / N
     theta_ = (opUD - op) / (2*dT)
     if normalize:
-        days = calander.trDays(startDate, T) if startDate else 252
-        T_ = T if startDate else 1
+        days = yearFrac.trDays(startDate, T) if np.size(startDate) else 252
+        T_ = T if np.size(startDate) else 1
         theta_ = theta_ * T_ / days  #normalize to calculate theta per day
     
     return theta_
@@ -217,3 +221,82 @@ def rho(S, K, r, T, vol, q,
     
     return rho_
 
+def crrJumps(vol, r, q, dT):
+    """Return the CRR up move and probability of an up move."""
+    priceUp = np.exp(vol * np.sqrt(dT))
+    probUp = (np.exp(np.subtract(r, q)*dT) - 1/priceUp) / (priceUp - 1/priceUp)
+    return priceUp, probUp
+
+def allGreeks(S, K, r, T, vol, q, call=True, american=True, N=5000,
+              startDate=(), normalize=True, deltaVol=10**-4, deltaR=10**-4):
+    """Return the price, delta, gamma, theta, vega and rho of an option.
+
+    Parameters
+    ----------
+    See document header.
+    american : bool, optional
+        If early exercise is allowed.
+    normalize : bool, optional
+        If theta will be normalized by days in the year.
+    deltaVol : float, optional
+        The change in vol used to approximate vega.
+    deltaR : float, optional
+        The change in intRate used to approximate rho.
+
+    Returns
+    -------
+    greeks : dict
+        Keys 'price', 'delta', 'gamma', 'theta', 'vega' and 'rho'.
+
+    Notes
+    -----
+    One chain sweep (see 'priceChain') prices the option at r - deltaR/2,
+    r and r + deltaR/2 on a shared CRR lattice, the first three levels of
+    the middle row give delta, gamma and theta (as in 'delta', 'gamma' and
+    'theta') and the outer rows give rho. A second sweep, with vol bumped
+    by deltaVol, gives vega as a forward difference. So the full set costs
+    about as much as 2 lattices, rather than 7.
+    
+    Example(s)
+    ----------
+    >>> allGreeks(95, 99, .08, 1, .2, .005)
+    >>> {'price': 9.078434785985344, 'delta': 0.602913466715248,
+         'gamma': 0.020153162836779, 'theta': -0.02859960848543264,
+         'vega': 36.32958504148576, 'rho': 48.198287337939405}
+
+    """
+    dT = T / N
+    rates = r + deltaR * np.array([-.5, 0, .5])
+    priceUp, probUp = crrJumps(vol, rates, q, dT)
+    
+    tree = priceChain(S, [K]*3, rates, T, priceUp, probUp, N, call,
+                      american, levels=3)
+    prA, price_, prB = tree[0][:, 0]
+    opD, opU = tree[1][1]
+    opDD, opUD, opUU = tree[2][1]
+
+    #delta and gamma from the first two levels
+    spU, spD = S*priceUp, S/priceUp
+    spUU, spDD = S*priceUp**2, S/priceUp**2
+    delta_ = (opU - opD) / (spU - spD)
+    
+    A, B = opUU - opUD, opUD - opDD
+    X, Y, Z = spUU - S, S - spDD, spUU - spDD
+    gamma_ = 2 * (A*Y - B*X) / (X*Y*Z)
+
+    theta_ = (opUD - price_) / (2*dT)
+    if normalize:
+        days = yearFrac.trDays(startDate, T) if np.size(startDate) else 252
+        T_ = T if np.size(startDate) else 1
+        theta_ = theta_ * T_ / days  #normalize to calculate theta per day
+
+    rho_ = (prB - prA) / deltaR
+    
+    priceUp, probUp = crrJumps(vol + deltaVol, r, q, dT)
+    prV = priceChain(S, K, r, T, priceUp, probUp, N, call, american)[0]
+    vega_ = (prV - price_) / deltaVol
+
+    greeks = {'price': price_, 'delta': delta_, 'gamma': gamma_,
+              'theta': theta_, 'vega': vega_, 'rho': rho_}
+    return greeks
+
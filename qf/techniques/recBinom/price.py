@@ -1,8 +1,12 @@
 """Implement recombining Binom Lattice to price a European Option."""
 
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.lattice import resolveJump, smoothStep, richardson
 
-def price(S, K, r, T, priceUp, probUp, depth=5000, call=True, levels=0):
+def price(S, K, r, T, priceUp, probUp, depth=5000, call=True, levels=0,
+          extrap=0, smooth=None):
     """Price a European option via the a recombining binomial tree.
 
     Parameters
@@ -11,11 +15,17 @@ def price(S, K, r, T, priceUp, probUp, depth=5000, call=True, levels=0):
     K       : float
     r       : float
     T       : float
-    priceUp : float : func fixed with req. params so float
-    probUp  : float : func fixed with req. params so float
+    priceUp : float, func : func fixed with req. params so float, or a
+                            func of the step length dT
+    probUp  : float, func : func fixed with req. params so float, or a
+                            func of the step length dT
     depth   : int
     call    : bool 
     levels  : int
+    extrap  : int   : If 2 or 3, Richardson extrapolate prices at depth,
+                      depth/2 (and depth/4). priceUp and probUp must be
+                      funcs of dT.
+    smooth  : tuple : (vol, q), if given the last step is priced by BSM.
 
     Returns
     -------
@@ -26,20 +36,32 @@ def price(S, K, r, T, priceUp, probUp, depth=5000, call=True, levels=0):
     >>> 
 
     """
+    if extrap:
+        pr = lambda N: price(S, K, r, T, priceUp, probUp, N, call, 0, 0, smooth)
+        return richardson(pr, depth, extrap)
+    
     dT = T / depth
     disc = np.exp(-r * dT)
+    priceUp, probUp = resolveJump(priceUp, dT), resolveJump(probUp, dT)
     
     #Value at expiry
     S *= priceUp ** np.arange(-depth, depth+1, 2, dtype=float)
     opPr = np.maximum(S - K, 0) if call else np.maximum(K - S, 0)
 
     rowsOut = [1] * levels
-    for i in np.arange(depth-1, -1, -1):
+    start = depth-1
+    if smooth: #Value one step before expiry
+        opPr = smoothStep(S[:-1]*priceUp, K, r, dT, *smooth, call)
+        start -= 1
+        if start < levels-1:
+            rowsOut[depth-1] = opPr.copy()
+            
+    for i in np.arange(start, -1, -1):
         opPr[:i+1] = disc * (probUp * np.ediff1d(opPr[:i+2]) + opPr[:i+1])
         opPr = np.maximum(opPr[:-1], 0)
 
         if levels and i < levels:
-            rowsOut[i] = opPr[:i+1]
+            rowsOut[i] = opPr[:i+1].copy()
             
     return opPr[0] if levels == 0 else rowsOut
 
@@ -0,0 +1,76 @@
+"""Implement recombining Binom Lattice to price a chain of options."""
+
+import numpy as np
+
+def priceChain(S, K, r, T, priceUp, probUp, depth=5000, call=True,
+               american=False, levels=0):
+    """Price options of one expiry, at many strikes, in a single sweep.
+
+    Parameters
+    ----------
+    S        : float
+    K        : array : Strikes, one row of the value array per strike.
+    r        : float, array : Broadcast against K (one rate per row).
+    T        : float
+    priceUp  : float : func fixed with req. params so float (shared by all
+                       rows, the stock price lattice is common to the chain)
+    probUp   : float, array : Broadcast against K (one prob. per row).
+    depth    : int
+    call     : bool, array : Broadcast against K, mask of calls.
+    american : bool : If early exercise is allowed.
+    levels   : int
+
+    Returns
+    -------
+    res : array : Price of each option in the chain, or if levels > 0 a
+        list with the (strikes x i+1) value arrays of the first levels.
+
+    Notes
+    -----
+    The stock lattice and the intrinsic values (on the two alternating rows
+    of the lattice) are built once for the chain. Each time step is then
+    one discounted update and, for American options, one broadcasted
+    np.maximum on the (strikes x nodes) value array, done in place.
+
+    Example(s)
+    ---------
+    >>> priceChain(100, [90, 100, 100], .08, .5, priUp, proUp, 5000,
+                   call=[True, True, False], american=True)
+    >>> array([15.42400168,  9.0408217 ,  5.52222476])
+
+    """
+    K = np.atleast_1d(np.asarray(K, dtype=float))
+    dT = T / depth
+    disc = np.broadcast_to(np.exp(-np.multiply(r, dT)), K.shape)[:, None]
+    discUp = disc * np.broadcast_to(probUp, K.shape)[:, None]
+    discDown = disc - discUp
+    sign = np.where(np.broadcast_to(call, K.shape), 1., -1.)[:, None]
+    K = K[:, None]
+    
+    #Intrinsic values on the two rows of the stock lattice
+    W = np.zeros((2, depth+1))
+    W[0] = np.arange(-depth, depth+1, 2, dtype=float)
+    W[1] = np.arange(-depth+1, depth+2, 2, dtype=float)
+    S = S * priceUp ** W
+    intrinsic = np.maximum(sign * (S[:, None, :] - K), 0)
+    
+    #Value at expiry
+    opPr = intrinsic[0].copy()
+    upVal = np.empty_like(opPr)
+    rowsOut = [1] * levels
+    for i in np.arange(depth-1, -1, -1):
+        M = i+1
+        V, U = opPr[:, :M], upVal[:, :M]
+        np.multiply(opPr[:, 1:M+1], discUp, out=U)
+        V *= discDown
+        V += U
+
+        if american:
+            row = (depth+i) % 2
+            A = (depth-i)//2
+            np.maximum(V, intrinsic[row][:, A:A+M], out=V)
+
+        if levels and i < levels:
+            rowsOut[i] = V.copy()
+            
+    return opPr[:, 0] if levels == 0 else rowsOut
@@ -3,6 +3,7 @@
 from price import price
 import numpy as np
 from priceAM import priceAM
+from priceChain import priceChain
 
 def priceJumps(vol, dT):
     up = np.exp(vol * np.sqrt(dT))
@@ -28,3 +29,22 @@ A = priceAM(S, K, r, T, priUp, proUp, depth, call=False)
 print(A)
 5.11976561573942
 
+"""Chain"""
+A = priceChain(S, [90, 100, 100], r, T, priUp, proUp, depth,
+               call=[True, True, False], american=True)
+print(A)
+#[15.42400168  9.0408217   5.52222476]
+
+"""Extrapolated"""
+priUp_ = lambda dT: priceJumps(vol, dT)
+proUp_ = lambda dT: probJumps(r, q, dT, priceJumps(vol, dT))
+A = priceAM(S, K, r, T, priUp_, proUp_, 200, call=False, extrap=2,
+            smooth=(vol, q))
+print(A)
+#5.522819975677631
+
+"""Greeks, one sweep"""
+from greeks import allGreeks
+A = allGreeks(95, 99, .08, 1, .2, .005)
+print(A['delta'], A['gamma'], A['theta'])
+#0.602913466715248 0.020153162836779 -0.02859960848543264
@@ -0,0 +1,50 @@
+"""Time Richardson extrapolated lattices against depth 5000 (American)."""
+
+import numpy as np
+from time import perf_counter
+from priceAm import priceAM
+
+def priceJumps(vol, dT):
+    u = np.exp(vol * np.sqrt(2*dT))
+    return [u, 1, 1/u]
+
+def probJumps(r, vol, q, dT):
+    
+    dT_ = dT/2
+    drift = (r-q) * dT_
+    noise = vol * np.sqrt(dT_)
+
+    A = np.exp(drift + noise)
+    B = np.exp(2*noise)
+    norm = np.square(B - 1)
+    
+    pU = np.square(A - 1) / norm
+    pD = np.square(B - A) / norm
+    pS = 1 - pU - pD
+    
+    return [pU, pS, pD]
+
+def timed(func, *args, **kwargs):
+    """Return the output of func and its run time in seconds."""
+    start = perf_counter()
+    res = func(*args, **kwargs)
+    return res, perf_counter() - start
+
+if __name__ == '__main__':
+    S, r, T, vol, q = 50, .05, 2, .3, .02
+    priUp = lambda dT: priceJumps(vol, dT)[0]
+    proJ = lambda dT: probJumps(r, vol, q, dT)
+    
+    print('{:<10}{:>12}{:>20}{:>20}{:>20}'.format(
+        'option', 'reference', 'depth 5000', 'extrap=2, 200', 'extrap=3, 200'))
+    for K, call in [(45, False), (52, False), (60, False), (52, True)]:
+        ref = priceAM(S, K, r, T, priUp, proJ, 8000, call,
+                      extrap=3, smooth=(vol, q))
+        row = [timed(priceAM, S, K, r, T, priUp(T/5000), proJ(T/5000),
+                     5000, call)]
+        for order in [2, 3]:
+            row.append(timed(priceAM, S, K, r, T, priUp, proJ, 200, call,
+                             extrap=order, smooth=(vol, q)))
+            
+        res = ''.join('{:>11.2e} ({:.4f}s)'.format(pr - ref, t) for pr, t in row)
+        print('{:<10}{:>12.6f}{}'.format(('C' if call else 'P') + str(K), ref, res))
@@ -1,4 +1,11 @@
 
+import numpy as np
+from price import price
+from priceAm import priceAM
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../time')))
+import yearFrac
+
 ###Greeks minus gamma
 def delta(S, K, r, T, vol, q,
          optionType, exerciseTimes=[], height=400,
@@ -70,8 +77,8 @@ def theta(spotPrice, strikePrice, intRate, T, vol, dividend,
     theta_ = (op[1]-op[0]) / (2*T/height)
 
     if normalize:
-        days = calander.trDays(startDate, T) if startDate else 252
-        T_ = T if startDate else 1
+        days = yearFrac.trDays(startDate, T) if np.size(startDate) else 252
+        T_ = T if np.size(startDate) else 1
         theta_ = theta_ * T_ / days  #normalize to calculate theta per day
 
     return theta_
@@ -146,3 +153,89 @@ def rho(spotPrice, strikePrice, intRate, T, vol, dividend,
     rho_ = (prB - prA) / deltaR
     
     return rho_
+
+def trinomJumps(vol, r, q, dT):
+    """Return the up move and the up/flat/down probabilities."""
+    dT_ = dT/2
+    drift = (r-q) * dT_
+    noise = vol * np.sqrt(dT_)
+
+    A = np.exp(drift + noise)
+    B = np.exp(2*noise)
+    norm = np.square(B - 1)
+    
+    pU = np.square(A - 1) / norm
+    pD = np.square(B - A) / norm
+    pS = 1 - pU - pD
+    
+    return np.exp(vol * np.sqrt(2*dT)), [pU, pS, pD]
+
+def allGreeks(S, K, r, T, vol, q, call=True, american=True, height=500,
+              startDate=(), normalize=True, deltaVol=10**-4, deltaR=10**-4):
+    """Return the price, delta, gamma, theta, vega and rho of an option.
+
+    Parameters
+    ----------
+    See document header.
+    american : bool, optional
+        If early exercise is allowed.
+    normalize : bool, optional
+        If theta will be normalized by days in the year.
+    deltaVol : float, optional
+        The change in vol used to approximate vega.
+    deltaR : float, optional
+        The change in intRate used to approximate rho.
+
+    Returns
+    -------
+    greeks : dict
+        Keys 'price', 'delta', 'gamma', 'theta', 'vega' and 'rho'.
+
+    Notes
+    -----
+    One backward induction keeps the first two levels of the lattice, the
+    three nodes one step in (S*d, S, S*u) give delta, gamma and theta. Rho
+    and vega are forward differences from one more lattice each, so the
+    full set costs 3 lattices.
+    
+    Example(s)
+    ----------
+    >>> allGreeks(95, 99, .08, 1, .2, .005)
+    >>> {'price': 9.07888212430722, 'delta': 0.6027453162612022,
+         'gamma': 0.020162244014290977, 'theta': -0.028603661212909002,
+         'vega': 36.265659208627454, 'rho': 48.19803636838316}
+
+    """
+    lattice = priceAM if american else price
+    dT = T / height
+    
+    priceUp, probJumps = trinomJumps(vol, r, q, dT)
+    tree = lattice(S, K, r, T, priceUp, probJumps, height, call, levels=2)
+    price_ = tree[0][0]
+    opD, opS, opU = tree[1]
+
+    spU, spD = S*priceUp, S/priceUp
+    delta_ = (opU - opD) / (spU - spD)
+    
+    A, B = opU - opS, opS - opD
+    X, Y, Z = spU - S, S - spD, spU - spD
+    gamma_ = 2 * (A*Y - B*X) / (X*Y*Z)
+
+    theta_ = (opS - price_) / dT
+    if normalize:
+        days = yearFrac.trDays(startDate, T) if np.size(startDate) else 252
+        T_ = T if np.size(startDate) else 1
+        theta_ = theta_ * T_ / days  #normalize to calculate theta per day
+
+    priceUp, probJumps = trinomJumps(vol, r + deltaR, q, dT)
+    prR = lattice(S, K, r + deltaR, T, priceUp, probJumps, height, call)
+    rho_ = (prR - price_) / deltaR
+    
+    priceUp, probJumps = trinomJumps(vol + deltaVol, r, q, dT)
+    prV = lattice(S, K, r, T, priceUp, probJumps, height, call)
+    vega_ = (prV - price_) / deltaVol
+
+    greeks = {'price': price_, 'delta': delta_, 'gamma': gamma_,
+              'theta': theta_, 'vega': vega_, 'rho': rho_}
+    return greeks
+
@@ -1,8 +1,12 @@
 """Implement recombining trinomial pricing model"""
 
 import numpy as np
+import sys, os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../../')))
+from helperFuncs.lattice import resolveJump, smoothStep, richardson
 
-def priceAM(S, K, r, T, priceUp, probJumps, depth=5000, call=True, levels=0):
+def priceAM(S, K, r, T, priceUp, probJumps, depth=5000, call=True, levels=0,
+            extrap=0, smooth=None):
     """Price a American option via the a recombining trinom tree.
 
     PriceJumps = X, 1, 1/X
@@ -14,11 +18,17 @@ def priceAM(S, K, r, T, priceUp, probJumps, depth=5000, call=True, levels=0):
     K       : float
     r       : float
     T       : float
-    priceUp : float  : func fixed with req. params so float
-    probJumps  : arr  : func fixed with req. params so float
+    priceUp : float  : func fixed with req. params so float, or a func
+                       of the step length dT
+    probJumps  : arr  : func fixed with req. params so float, or a func
+                        of the step length dT
     depth   : int
     call    : bool 
     levels  : int
+    extrap  : int   : If 2 or 3, Richardson extrapolate prices at depth,
+                      depth/2 (and depth/4). priceUp and probJumps must be
+                      funcs of dT.
+    smooth  : tuple : (vol, q), if given the last step is priced by BSM.
 
     Returns
     -------
@@ -29,17 +39,29 @@ def priceAM(S, K, r, T, priceUp, probJumps, depth=5000, call=True, levels=0):
     >>> 
 
     """
+    if extrap:
+        pr = lambda N: priceAM(S, K, r, T, priceUp, probJumps, N, call, 0, 0, smooth)
+        return richardson(pr, depth, extrap)
+    
     dT = T / depth
     disc = np.exp(-r * dT)
-    pU, pS, pD = probJumps
+    priceUp = resolveJump(priceUp, dT)
+    pU, pS, pD = resolveJump(probJumps, dT)
 
     #Value at expiry
     S *= priceUp ** np.arange(-depth, depth+1, dtype=float)
     opPr = np.maximum(S - K, 0) if call else np.maximum(K - S, 0)
 
     rowsOut = [1] * levels
+    start = depth-1
+    if smooth: #Value one step before expiry
+        opPr = smoothStep(S[1:-1], K, r, dT, *smooth, call, american=True)
+        start -= 1
+        if start < levels-1:
+            rowsOut[depth-1] = opPr.copy()
+    
     #Value at earlier times
-    for i in np.arange(depth-1, -1, -1):
+    for i in np.arange(start, -1, -1):
         M = 2*i+1
         opPr[:M] = disc * (pU*opPr[2:M+2] + pS*opPr[1:M+1] + pD*opPr[:M])
 
@@ -48,6 +70,6 @@ def priceAM(S, K, r, T, priceUp, probJumps, depth=5000, call=True, levels=0):
         opPr = np.maximum(opPr[:M], ex)
 
         if levels and i < levels:
-            rowsOut[i] = opPr[:M]
+            rowsOut[i] = opPr[:M].copy()
    
     return opPr[0] if levels == 0 else rowsOut
@@ -54,3 +54,17 @@ print(A)
 A = priceAM(S, K, r, T, priUp, proJ, depth, call=False)
 print(A)
 7.472077507429825
+
+"""Extrapolated"""
+priUp_ = lambda dT: priceJumps(vol, dT)[0]
+proJ_ = lambda dT: probJumps(r, vol, q, dT)
+A = priceAM(S, K, r, T, priUp_, proJ_, 200, call=False, extrap=2,
+            smooth=(vol, q))
+print(A)
+#7.472487216880883
+
+"""Greeks, one sweep"""
+from greeks import allGreeks
+A = allGreeks(95, 99, .08, 1, .2, .005)
+print(A['delta'], A['gamma'], A['theta'])
+#0.6027453162612022 0.020162244014290977 -0.028603661212909002
@@ -1,10 +1,13 @@
 """Implement TradingTime class."""
 
 from numpy import datetime64 as dt64
+import numpy as np
 import datetime as dt
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'offline'))
 import fastCalander
-from calander import dt64_tuple, dateToDay
-import timeDicts
+import calander
+from calander import dt64_tuple, dateToDay, asDates
 
 class TradingTime:
     """This class implements trading time structure."""
@@ -30,7 +33,7 @@ class TradingTime:
         self.date = dt64(date)
         self.ical = self.date - fastCalander.startD
         self.n = fastCalander.enumDate(self.date)
-        self.day, self.month, self.year = calander.dt64_tuple(self.date)
+        self.day, self.month, self.year = calander.dt64_tuple(str(self.date))
 
     @property
     def dayOfWeek(self):
@@ -74,7 +77,7 @@ class TradingTime:
 
     def trYears(self, arr):
         """Return an array of time in years from self.time to times in arr."""
-        return np.array([X - self.time for X in arr])
+        return TradingTimeArray(arr) - self.date
 
     @property
     def fracYear(self):
@@ -114,3 +117,72 @@ class TradingTime:
     def __str__(self):
         """Return str(self)."""
         return '\n'.join([f'{x}: {repData[x]}' for x in self.inputDict])
+
+class TradingTimeArray:
+    """Array of dates with their trading day enumerations, vectorized."""
+
+    #let numpy operands defer to __rsub__ / __radd__
+    __array_ufunc__ = None
+
+    def __init__(self, dates):
+        """Initialize trading time array.
+
+        Paramaters
+        ----------
+        dates: datetime64_like(s) or (d, m, y) : Dates to initialize.
+
+        Initializes
+        -----------
+        dates: ndarray : datetime64[D] array of the inputs.
+        n    : ndarray : Trading days from 1/1/2000 to each date.
+        clock: ndarray : Trading years from 1/1/2000 to each date.
+
+        Notes
+        -----
+        Dates must lie in 2000 - 2049, see fastCalander.
+        
+        """
+        self.dates = asDates(dates)
+        self.n = fastCalander.enumDate(self.dates)
+        self.clock = fastCalander.clock(self.dates)
+
+    def __len__(self):
+        return self.dates.size
+
+    def __getitem__(self, idx):
+        return TradingTimeArray(self.dates[idx])
+
+    def __sub__(self, X):
+        """Return self - X in trading years, or self minus X years if X is."""
+        if isinstance(X, TradingTimeArray):
+            return self.clock - X.clock
+        X = np.asarray(X)
+        if np.issubdtype(X.dtype, np.number):
+            return self + (-X)
+        return self.clock - fastCalander.clock(asDates(X))
+
+    def __rsub__(self, X):
+        """Return X - self in trading years, X date(s)."""
+        return fastCalander.clock(asDates(X)) - self.clock
+
+    def __add__(self, T):
+        """Return the trading days T (trading) years after each date."""
+        return TradingTimeArray(fastCalander.addYears(T, self.dates))
+
+    __radd__ = __add__
+
+    def trDays(self, T):
+        """Return # of trading days in [date, date + T years), per date."""
+        return fastCalander.enumDate(fastCalander.addYears(T, self.dates)) - self.n
+
+    def oneDay(self, T):
+        """Return time in years of one day over [date, date + T], per date."""
+        return T / self.trDays(T)
+
+    def trYears(self, arr):
+        """Return time in years from each date to the dates in arr."""
+        return TradingTimeArray(arr) - self
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return f'TradingTimeArray(dates={repr(self.dates)})'
@@ -1,75 +1,111 @@
 """Fast Calander Functions For 2000-2050."""
 
-import pickle
-import timeDicts as *
-from calander import dt64_tuple
-from generateEnumeration import gen_isLeap, gen_numLeaps
-
-startD = np.datetime64('2000-1-1')
-
-def yearFromEnum(i):
-    est = 2000 + i // 365
-    if enumYears[est] > i:
-        return est + 1
-    elif enumYears[est] < i < enumYears[est+1]:
-        return 
-    
-def days(year):
-    """# of calander or trading days in [1/1/year, 12/31/year]"""
-    return trDaysinYear[year]
+import os
+import numpy as np
+
+startD = np.datetime64('2000-01-01')
+
+#trDaysTally[k] = # of trading days in [1/1/2000, 1/1/2000 + k days)
+#int32 array written by offline/generateEnumeration.py, memory-mapped
+tallyPath = os.path.join(os.path.dirname(__file__), 'timeHashes', 'trDayTally.npy')
+trDaysTally = np.load(tallyPath, mmap_mode='r')
+endD = startD + (len(trDaysTally) - 1) #1/1/2050, first day not covered
 
-with open("trDayTally.pickle", 'rb') as trData:
-    trDaysTally = pickle.load(trData)
+def dayIndex(date):
+    """Return calander days from 1/1/2000 to date, date: datetime64(s).
+
+    Raises ValueError for dates outside of 2000 - 2049.
+    """
+    k = (np.asarray(date, dtype='datetime64[D]') - startD).astype(np.int64)
+    if np.any((k < 0) | (k >= len(trDaysTally) - 1)):
+        raise ValueError(f'Dates must lie in [{startD}, {endD}), '
+                         'the 2000 - 2049 range of the tally.')
+    return k
+
+def yearIndex(year):
+    """Return dayIndex of 1/1/year, year: int(s) in 2000 - 2050."""
+    year = np.asarray(year)
+    if np.any((year < 2000) | (year > 2050)):
+        raise ValueError('Years must lie in 2000 - 2050 (2050 as an end).')
+    firstDay = (year - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+    return (firstDay - startD).astype(np.int64)
+
+def getYear(date):
+    """Return the year(s) of datetime64(s)."""
+    years = np.asarray(date, dtype='datetime64[D]').astype('datetime64[Y]')
+    return years.astype(np.int64) + 1970
+
+def days(year):
+    """# of trading days in [1/1/year, 12/31/year]"""
+    return trDaysYr(year, np.asarray(year) + 1)
 
 ##MAIN FUNCTION
 def enumDate(date):
     """Return i s.t. date = 1/1/2000 +_{trading} i days
 
-    date: datetime64
+    date: datetime64 or array of datetime64
 
     """
-    return trDaysTally[date-startD]
+    return trDaysTally[dayIndex(date)]
 
-def isTradingDay(i):
-    return i in trDaysTally
+def isTradingDay(date):
+    """Return if date (datetime64 or array of) is a trading day."""
+    k = dayIndex(date)
+    return trDaysTally[k+1] > trDaysTally[k]
 
-def trDays(i, j):
-    """Return # of trading days in [min_date, max_date2].
+def trDays(date1, date2):
+    """Return # of trading days in [min_date, max_date].
 
-    note i, j are the enumDates of two dates.
+    date1, date2 are datetime64 or arrays of datetime64 (broadcast).
     """
-    mx, mn = max(i, j), min(i, j)
+    i, j = dayIndex(date1), dayIndex(date2)
+    mx, mn = np.maximum(i, j), np.minimum(i, j)
     return trDaysTally[mx+1] - trDaysTally[mn]
 
 def trDaysYr(year1, year2):
-    """Return # of trading days in [1/1/year1, 1/1/year2]."""
-    i, j = enumYears[year1], enumYears[year2]
-    return trDays(i, j)
+    """Return # of trading days in [1/1/year1, 1/1/year2)."""
+    return trDaysTally[yearIndex(year2)] - trDaysTally[yearIndex(year1)]
 
-def fracYear(i):
+def fracYear(date):
     """Return (Number of tr Days In [1/1/year, date]) / (days in year)."""
-    year = yearFromEnum(i)
-    yrStart = enumYears[year]
-    num = trDaysTally[i+1] - trDaysTally[yrStart]
+    year = getYear(date)
+    num = trDaysTally[dayIndex(date)+1] - trDaysTally[yearIndex(year)]
     return num / days(year)
 
-def futDateEnum(i, T):
-    """Return enumDate(date + T)."""
-    day, month, year = date
-    portionDone = fracYear(i)
-    i_t = enumDate(date, tradingYear)
-
-    endYr = (year + portionDone + T) // 1
-    dYr = endYr - year + 1
-    avgDays = (trDaysYr(year, endYr + 1)) / (dYr + 1)
-    res = i + avgDays*T
-        
-    return res
-            
-def oneDay(date, T, tradingYear=False):
+def futDateEnum(date, T):
+    """Return enumDate(date + T), T in trading years of the year of date."""
+    return enumDate(date) + np.rint(T*days(getYear(date))).astype(np.int64)
+
+def oneDay(date, T):
     """Return portion of time from [date, date+T] one day is."""
-    i, j = enumDate(date), futDateEnum(date, T, tradingYear)
-    mx, mn = max(i, j), min(i, j)
-    totDays = trDaysTally[mx+1] - trDaysTally[mn]
-    
+    totDays = futDateEnum(date, T) - enumDate(date)
     return 1 / totDays
+
+def clock(date):
+    """Return trading years from 1/1/2000 to the start of date(s).
+
+    year - 2000 + (trading days elapsed in year) / (trading days in year),
+    so clock(date2) - clock(date1) is calander.dateToYears(date1, date2).
+    """
+    year = getYear(date)
+    elapsed = trDaysTally[dayIndex(date)] - trDaysTally[yearIndex(year)]
+    return (year - 2000) + elapsed / days(year)
+
+#yearClock[k] = clock(1/1/2000 + k days), non-decreasing
+yearClock = clock(startD + np.arange(len(trDaysTally) - 1))
+
+def addYears(T, date):
+    """Return the trading day T trading years after date(s).
+
+    See calander.addYears, the last day whose clock is <= clock(date) + T.
+    Raises ValueError if that day is not before 1/1/2050 (clock 50).
+    """
+    target = clock(date) + np.asarray(T) + 1e-12
+    if np.any(target >= 2050 - 2000):
+        raise ValueError(f'Dates must lie in [{startD}, {endD}), '
+                         'the 2000 - 2049 range of the tally.')
+    return startD + (np.searchsorted(yearClock, target, side='right') - 1)
+
+def trDaysAhead(date, T):
+    """Return # of trading days in [date, addYears(T, date)), see calander.trDays."""
+    return enumDate(addYears(T, date)) - enumDate(date)
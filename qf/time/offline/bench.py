@@ -0,0 +1,63 @@
+"""Time the busdaycalendar engine against the per-call calander functions."""
+
+from timeit import timeit
+import numpy as np
+from calander import (nyseHolidays, tradingDays, dateToYears, addYears,
+                      getYear)
+
+def loopTradingDays(date1, date2):
+    """Trading days with the holidays rebuilt per call, as before."""
+    holidays = nyseHolidays(getYear(date1), getYear(date2) + 1)
+    weekdayHolidays = np.sum((date1 <= holidays) & (holidays < date2)
+                             & np.is_busday(holidays))
+    return np.busday_count(date1, date2) - weekdayHolidays
+
+def loopDateToYears(date1, date2):
+    """Four trading day counts per call, as before."""
+    floor1 = date1.astype('datetime64[Y]').astype('datetime64[D]')
+    floor2 = date2.astype('datetime64[Y]').astype('datetime64[D]')
+    ceil1 = (date1.astype('datetime64[Y]') + 1).astype('datetime64[D]')
+    ceil2 = (date2.astype('datetime64[Y]') + 1).astype('datetime64[D]')
+    
+    yrJump = getYear(date2) - getYear(date1) - 1
+    ratio1 = loopTradingDays(date1, ceil1) / loopTradingDays(floor1, ceil1)
+    ratio2 = loopTradingDays(floor2, date2) / loopTradingDays(floor2, ceil2)
+    return yrJump + ratio1 + ratio2
+
+def loopAddYears(T, date):
+    """Step one day at a time from a calander day guess, as before."""
+    endD = date + int(365*T)
+    while 1:
+        if T < loopDateToYears(date, endD) - 1e-12:
+            endD -= 1
+        elif T >= loopDateToYears(date, endD + 1) - 1e-12:
+            endD += 1
+        else:
+            return endD
+
+def compare(name, old, new, number):
+    """Print the mean time per call of two callables and the speedup."""
+    tOld = timeit(old, number=number) / number
+    tNew = timeit(new, number=number) / number
+    print('{:<22}{:>12.2f}ms{:>12.2f}ms{:>10.1f}x'.format(
+        name, 1e3*tOld, 1e3*tNew, tOld/tNew))
+
+if __name__ == '__main__':
+    rng = np.random.default_rng(0)
+    start = np.datetime64('2024-01-02')
+    ends = start + rng.integers(1, 3*365, 1000)
+    T = rng.uniform(0, 3, 100)
+
+    assert all(loopTradingDays(start, x) == tradingDays(start, x) for x in ends)
+    assert all(loopAddYears(t, start) == addYears(t, start) for t in T[:10])
+
+    print('{:<22}{:>14}{:>14}{:>11}'.format('', 'loop', 'array', 'speedup'))
+    compare('tradingDays, 1e3',
+            lambda: [loopTradingDays(start, x) for x in ends],
+            lambda: tradingDays(start, ends), 3)
+    compare('dateToYears, 1e3',
+            lambda: [loopDateToYears(start, x) for x in ends],
+            lambda: dateToYears(start, ends), 3)
+    compare('addYears, 1e2',
+            lambda: [loopAddYears(t, start) for t in T],
+            lambda: addYears(T, start), 1)
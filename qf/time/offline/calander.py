@@ -3,6 +3,7 @@
 from numpy import datetime64
 import numpy as np
 from dataclasses import dataclass
+from itertools import count
 
 monthToInt = {
     'JAN' : 1,
@@ -336,7 +337,7 @@ def dateToDay(date):
     >>> 'SUN'
         
     """
-    weekEnum = date.astype('datetime64[D]').view('int64') - epoch.weekEnum) % 7
+    weekEnum = (date.astype('datetime64[D]').view('int64') + 4) % 7 #1/1/1970 THU
     return orderingOfWeek[weekEnum]
 
 def getYear(date):
@@ -351,7 +352,7 @@ def getYear(date):
     int: Year portion of date.  
 
     """
-    return int(str(date)[:5])
+    return int(str(date)[:4])
 
 def getMonth(date):
     """Return the month portion of the date.
@@ -413,7 +414,7 @@ def ceilDate(date, month=True, year=False):
     
     """
     curMonth = getMonth(date)
-    if curMonth == 12 and month=True:
+    if curMonth == 12 and month:
         isoString = f'{getYear(date)+1}'
     elif month:
         month_ = curMonth + 1
@@ -585,17 +586,134 @@ def tradingHolidays(date1, date2):
         #Fixed day holidays
         for hol in fixedDay:
             month, day, occ = fixedDay[hol]
-            day_ = (monthCalander(month, year)[day][occ]
+            day_ = monthCalander(month, year)[day][occ]
             month_ = monthToInt[month]
             holDate = tuple_dt64((day_, month_, year))
             holidays[hol].append(holDate)
 
     #Remove holidays before date1 or after date2
     inRange = lambda arr: [x for x in arr if date1 <= x < date2]
-    holidays = [hol: inRange(holidays[hol]) for hol in holiday]
+    holidays = {hol: inRange(holidays[hol]) for hol in holidays}
 
     return holidays
 
+def observed(dates):
+    """Move weekend holidays to the nearest weekday (SAT -> FRI, SUN -> MON)."""
+    weekEnum = (dates.astype('datetime64[D]').view('int64') + 4) % 7
+    return dates + np.where(weekEnum == 6, -1, 0) + np.where(weekEnum == 0, 1, 0)
+
+def nthWeekday(year, month, day, occ):
+    """Return the occ-th (0-based, -1 = last) 'day' of a month, per year."""
+    first = np.array([f'{y}-{month:02d}' for y in year], dtype='datetime64[M]')
+    if occ < 0:
+        return np.busday_offset(first + 1, occ, roll='forward', weekmask=day)
+    return np.busday_offset(first, occ, roll='forward', weekmask=day)
+
+def nyseHolidays(year1=2000, year2=2050):
+    """Return the sorted NYSE full holidays in [1/1/year1, 1/1/year2).
+
+    Same rules as 'tradingHolidays' (New Year's Day on a Saturday is not
+    moved to Friday, Rule 7.2 of NYSE), computed for all years at once,
+    plus the one-off closures in 'exceptionDates'.
+    """
+    years = np.arange(year1, year2)
+    fixed = lambda m, d: np.array([f'{y}-{m:02d}-{d:02d}' for y in years],
+                                  dtype='datetime64[D]')
+    
+    newYears = fixed(1, 1)
+    newYears = np.where(observed(newYears) < newYears, newYears,
+                        observed(newYears))
+    juneteenth = observed(fixed(6, 19))[years >= 2022]
+    holidays = [newYears, juneteenth, observed(fixed(7, 4)),
+                observed(fixed(12, 25))]
+
+    for hol in fixedDay:
+        month, day, occ = fixedDay[hol]
+        holidays.append(nthWeekday(years, monthToInt[month], day.title(), occ))
+
+    goodFridays = [goodFriday(y) for y in years]
+    holidays.append(np.array([f'{y}-{m:02d}-{d:02d}' for d, m, y in goodFridays],
+                             dtype='datetime64[D]'))
+
+    exceptions = [x for y in years for x in exceptionDates.get(y, ())]
+    holidays.append(np.array([f'{y}-{m:02d}-{d:02d}' for d, m, y in exceptions],
+                             dtype='datetime64[D]'))
+
+    return np.unique(np.concatenate(holidays))
+
+#Calander engine: NYSE holidays, 2000 - 2049, built by 'setHolidays'
+calStart, calEnd = datetime64('2000-01-01'), datetime64('2050-01-01')
+
+def buildClock(busdaycal):
+    """Return yearClock of a busdaycalendar, see 'setHolidays'."""
+    calDays = np.arange(calStart, calEnd + 1)
+    years = calDays.astype('datetime64[Y]')
+    elapsed = np.busday_count(years.astype('datetime64[D]'), calDays,
+                              busdaycal=busdaycal)
+    yearLength = np.busday_count(years.astype('datetime64[D]'),
+                                 (years + 1).astype('datetime64[D]'),
+                                 busdaycal=busdaycal)
+    return (years.astype(np.int64) - 30) + elapsed / yearLength
+
+calendarIds = count()
+
+def setHolidays(holidays):
+    """Rebuild the calander engine from a table of holidays.
+
+    Sets
+    ----
+    nyseCalendar : busdaycalendar : Weekends and 'holidays' off.
+    yearClock    : ndarray : yearClock[k] = trading years elapsed from the
+        start of 2000 to the start of calStart + k days, i.e.
+        year + (trading days elapsed) / (trading days in year).
+    calendarId   : int : Identifies the holiday table, a new id for every
+        table set (never reused, unlike a hash of the table).
+
+    Notes
+    -----
+    Year fractions cached by time/yearFrac.py are keyed on 'calendarId', so
+    a new table is never served stale values; call yearFrac.invalidate()
+    to free the old entries. The tally read by fastCalander is not rebuilt,
+    see generateEnumeration.py.
+
+    """
+    global nyseCalendar, yearClock, calendarId
+    nyseCalendar = np.busdaycalendar(holidays=holidays)
+    yearClock = buildClock(nyseCalendar)
+    calendarId = next(calendarIds)
+
+setHolidays(nyseHolidays())
+
+def asDates(date):
+    """Return datetime64[D](s) from datetime64_like(s) or a (d, m, y) tuple."""
+    if isinstance(date, tuple) and len(date) == 3:
+        d, m, y = date
+        return datetime64(f'{y}-{m:02d}-{d:02d}')
+    return np.asarray(date, dtype='datetime64[D]')
+
+def checkRange(dates):
+    """Raise ValueError unless all dates lie in [calStart, calEnd]."""
+    if np.any((dates < calStart) | (dates > calEnd)):
+        raise ValueError(f'Dates must lie in [{calStart}, {calEnd}], '
+                         'the range of the calander engine.')
+    return dates
+
+def clock(date):
+    """Return yearClock at date(s), for 1/1/2000 <= date <= 1/1/2050."""
+    return yearClock[(checkRange(asDates(date)) - calStart).astype(np.int64)]
+
+def calendarFor(dates1, dates2):
+    """Return nyseCalendar, or a calendar of the years spanned if outside it.
+
+    Dates outside of 2000 - 2049 get the NYSE holiday rules ('nyseHolidays')
+    of the years they span, not a table set by 'setHolidays'.
+    """
+    lo, hi = np.minimum(dates1, dates2).min(), np.maximum(dates1, dates2).max()
+    if calStart <= lo and hi <= calEnd:
+        return nyseCalendar
+    years = np.array([lo, hi]).astype('datetime64[Y]').astype(np.int64) + 1970
+    return np.busdaycalendar(holidays=nyseHolidays(years[0], years[1] + 1))
+
 def tradingDays(date1, date2):
     """Return the expected number of trading from date1 to the start of date2.
 
@@ -620,16 +738,18 @@ def tradingDays(date1, date2):
     Sunday, or Monday the answer is 5 trading days, since Friday has
     fully elapsed.
 
+    Dates outside of 2000 - 2049 are counted with the NYSE holidays of the
+    years spanned, see 'calendarFor'.
+
     Example(s)
     ----------
     >>> tradingDays((8,7,2010), (28,2,2011))
-    >>> 159
+    >>> 162
 
     """
-    holidays = tradingHolidays(date1, date2)
-    weekdayHolidays = sum([len(holidays[hol]) for hol in holidays])
-    weekdays = np.busday_count(date1, date2)
-    return weekdays - weekdayHolidays
+    dates1, dates2 = asDates(date1), asDates(date2)
+    return np.busday_count(dates1, dates2,
+                           busdaycal=calendarFor(dates1, dates2))
 
 def dateToYears(date1, date2):
     """Return the time from date1 to date2 as a fraction of a trading year.
@@ -640,30 +760,26 @@ def dateToYears(date1, date2):
     
     Parameters
     ----------
-    date1: datetime64: Start date.
-    dare2: datetime64: End date.
+    date1: datetime64: Start date(s).
+    dare2: datetime64: End date(s).
         
     Returns
     -------
     T : float: Time in (trading) years between the two dates.
 
+    Notes
+    -----
+    The remainder of the year of date1 and the elapsed part of the year of
+    date2 are each measured in trading days of their own year, plus the
+    whole years in between. Arrays broadcast.
+
     Example(s)
     ----------
     >>> dateToYears((1,1,2024),(1,1,2025))
     >>> 1.0
     
     """
-    yr1, yr2 = getYear(date1), getYear(date2)
-    floor1, floor2 = floorDate(date1, year=True), floorDate(date2, year=True)
-    ceil1, ceil2 = ceilDate(date1, year=True), ceilDate(date2, year=True)
-    
-    yrJump = yr2 - yr1 - 1
-    ratio1 = tradingDays(date1, ceil1) / tradingDays(floor1, ceil1)
-    ratio2 = tradingDays(new2, ceil2) / tradingDays(new2, ceil2)
-
-    T = yrJump + ratio1 + ratio2
-    
-    return T
+    return clock(date2) - clock(date1)
 
 def addYears(T, date):
     """Add trading years to the first trading day on or after a given date.
@@ -675,36 +791,30 @@ def addYears(T, date):
     
     Parameters
     ----------
-    T : float: Time in years.
-    date : datetime64 : Date.
+    T : float: Time(s) in years.
+    date : datetime64 : Date(s).
         
     Returns
     -------
     endD : datetime64: Date of trading day a prescribed distance from the start.
 
+    Notes
+    -----
+    endD is the last day with dateToYears(date, endD) <= T, found by a
+    searchsorted on 'yearClock'; the clock is flat over days off, so endD
+    is the trading day on which the time T has elapsed. Arrays broadcast.
+
     Example(s)
     ----------
     >>> addYears(2/252, (1,1,2024))
     >>> (4, 1, 2024)
     
     """
-    endD = int(365*T) + date
-    while 1:
-        if T < dateToYears(date, endD):
-            endD -= 1
-        elif T >= dateToYears(date, endD + 1):
-            endD += 1
-        else: #T is bounded by dateToYears range of endD
-            break
-    
-    #Determine if endD is a trading day, adjust if needed
-    fixed = endD - 7
-    endMinus = endD - 1
-    while tradingDays(fixed, endD) == endMinus:
-        endD = endMinus
-        endMinus -= 1
-    
-    return endD
+    target = clock(date) + np.asarray(T) + 1e-12
+    if np.any(target > yearClock[-1] + 2e-12):
+        raise ValueError(f'Dates must lie in [{calStart}, {calEnd}], '
+                         'the range of the calander engine.')
+    return calStart + (np.searchsorted(yearClock, target, side='right') - 1)
 
 def trDays(startD, T):
     """Return total trading days from startD to T years from startD.
@@ -750,7 +860,7 @@ def oneDay(startD, T):
 def timeList(date_arr, start):
     #Return [dateToYears(start, x) for x in date_arr]
     """start and date_arr entries are datetime64"""
-    return [dateToYears(start, x) for x in date_arr]
+    return dateToYears(start, np.asarray(date_arr, dtype='datetime64[D]'))
 
 def enumWeekends(year):
     """Return weekends : set, s.t. i in weekends if i is enum(weekend)"""
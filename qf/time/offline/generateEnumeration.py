@@ -1,8 +1,8 @@
 """Functions to generate trading day enumeration between 2000 and 2050."""
 
-from calander import tradingDays, enumDate, enumWeekends, enumDateTuple_, tradingHolidays, enumExceptions
+from calander import tradingDays, nyseCalendar
 from numpy import datetime64
-import pickle
+import numpy as np
 
 def gen_isLeap(year):
     """Return if leap year, 1999 < year < 2100"""
@@ -32,28 +32,14 @@ def gen_trDaysInYear(yearEnd=2049):
     return trDaysInYear
 
 def gen_trDayTally(yearEnd=2049):
-    Y = yearEnd + 1
-    daysFrom2000 = (Y - 2000)*365 + gen_numLeaps(Y + 1) + 1
-    trDayTally = {i: 0 for i in range(daysFrom2000+1)}
-
-    i = 0
-    for year in range(2000, Y):
-        sD, eD = datetime64(str(year)), datetime64(str(year+1))
-        daysInYear = 366 if gen_isLeap(year) else 365
-        weekends = enumWeekends(year)
-        holidays = {enumDateTuple_(x) for x in tradingHolidays(sD, eD).values()}
-        enumedDaysOff = weekends | holidays
-        for j in range(daysInYear):
-            i += 1
-            trDayTally[i] = trDayTally[i-1]
-            if not (j in enumExceptions[year] or j in enumedDaysOff):
-                trDayTally[i] += 1
-            
-    return trDayTally
-
-def write_trDayTally(yearEnd=2049):
-    trDayTally = gen_trDayTally(yearEnd)
-    with open('trDayTally.pickle', 'wb') as f: 
-        pickle.dump(trDayTally, f, pickle.HIGHEST_PROTOCOL)
-
-write_trDayTally()
+    """trDayTally[i] = # trading days in [1/1/2000, 1/1/2000 + i days)."""
+    days = np.arange(datetime64('2000-01-01'), datetime64(f'{yearEnd+1}-01-01'))
+    isTrDay = np.is_busday(days, busdaycal=nyseCalendar)
+    return np.concatenate(([0], np.cumsum(isTrDay))).astype(np.int32)
+
+def write_trDayTally(yearEnd=2049, fileName='trDayTally.npy'):
+    """Save the tally as an int32 array (np.save), see fastCalander."""
+    np.save(fileName, gen_trDayTally(yearEnd))
+
+if __name__ == "__main__":
+    write_trDayTally()
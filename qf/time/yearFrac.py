@@ -0,0 +1,181 @@
+"""Memoize year fractions of repeated (start, end) pairs."""
+
+import numpy as np
+from collections import OrderedDict
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'offline'))
+import calander
+from calander import asDates
+
+class YearFracCache:
+    """Least recently used cache of year fractions, bounded by # of entries."""
+
+    def __init__(self, maxEntries=2**16):
+        """Initialize an empty cache holding at most 'maxEntries' values."""
+        self.maxEntries = maxEntries
+        self.store = OrderedDict()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def __repr__(self):
+        """Return repr(self)."""
+        return f'YearFracCache(maxEntries={self.maxEntries})'
+
+    def __len__(self):
+        """Return the number of cached values."""
+        return len(self.store)
+
+    def get(self, key):
+        """Return the value stored under key (None if absent)."""
+        res = self.store.get(key)
+        if res is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.store.move_to_end(key)
+        return res
+
+    def put(self, key, val):
+        """Store val under key, evicting the least recently used values."""
+        self.store[key] = val
+        self.store.move_to_end(key)
+        while len(self.store) > self.maxEntries:
+            self.store.popitem(last=False)
+            self.evictions += 1
+        return val
+
+    def invalidate(self, calId=None):
+        """Drop the values of calander 'calId', or of every calander if None.
+
+        Keys end with the calander id, see 'lookup'. Call after the holiday
+        table changes (calander.setHolidays) to free the stale values.
+        """
+        stale = [key for key in self.store if calId is None or key[-1] == calId]
+        for key in stale:
+            del self.store[key]
+        self.invalidations += len(stale)
+
+    def clear(self):
+        """Empty the cache and reset the counters."""
+        self.store.clear()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def info(self):
+        """Return a dict with the hit/miss counts and size."""
+        lookups = self.hits + self.misses
+        return {'hits': self.hits, 'misses': self.misses,
+                'hitRate': self.hits/lookups if lookups else 0.,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'entries': len(self.store), 'maxEntries': self.maxEntries}
+
+yearFracCache = YearFracCache()
+
+def distinct(key):
+    """Return the distinct values of a 1-D key and the inverse index.
+
+    Equal keys are usually adjacent (a chain listed by expiry), so the
+    unique is taken over the first key of each run only.
+    """
+    new = np.ones(key.size, dtype=bool)
+    np.not_equal(key[1:], key[:-1], out=new[1:])
+    runs = np.flatnonzero(new)
+    uniq, inv = np.unique(key[runs], return_inverse=True)
+    return uniq, np.repeat(inv, np.diff(np.append(runs, key.size)))
+
+def lookup(func, start, end, cache=yearFracCache):
+    """Return func(start, end) elementwise, computing each distinct pair once.
+
+    Parameters
+    ----------
+    func  : func : Vectorized calander function of (dates, end).
+    start : datetime64_like(s) or (d, m, y) : Start date(s).
+    end   : array_like : End date(s) as int days since 1/1/1970, or years.
+    cache : YearFracCache, optional : Cache to store values in.
+
+    Returns
+    -------
+    res : float or ndarray : Values broadcast to the shape of the inputs.
+
+    Notes
+    -----
+    Inputs are reduced to their distinct (start, end) pairs, each looked up
+    once under (func, start, end, calander.calendarId); the misses are
+    computed by one vectorized call of 'func'. With one start date the
+    pairs are the distinct ends, else each pair is packed into one complex
+    key (start + i*end, exact for day counts and floats).
+
+    """
+    days, end = asDates(start).astype(np.int64), np.asarray(end)
+    shape = np.broadcast_shapes(days.shape, end.shape)
+    if days.ndim == 0:
+        uniq, inv = distinct(np.broadcast_to(end, shape).ravel())
+        starts, ends = np.full(uniq.size, days), uniq
+    else:
+        days, end = np.broadcast_arrays(days, end)
+        uniq, inv = distinct(days.ravel() + 1j*end.ravel())
+        starts, ends = uniq.real.astype(np.int64), uniq.imag
+
+    calId, name = calander.calendarId, func.__name__
+    keys = [(name, s, e, calId) for s, e in zip(starts.tolist(), ends.tolist())]
+    vals = [cache.get(key) for key in keys]
+    miss = [k for k, val in enumerate(vals) if val is None]
+    if miss:
+        dates = starts[miss].astype('datetime64[D]')
+        new = np.atleast_1d(func(dates, ends[miss]))
+        for k, val in zip(miss, new.tolist()):
+            vals[k] = cache.put(keys[k], val)
+
+    res = np.array(vals)[inv].reshape(shape)
+    return res[()] if res.ndim == 0 else res
+
+def yearsBetween(dates, ends):
+    """Return calander.dateToYears with ends as days since 1/1/1970."""
+    return calander.dateToYears(dates, ends.astype(np.int64).astype('datetime64[D]'))
+
+def dateToYears(date1, date2):
+    """Return the time from date1 to date2 in trading years, memoized.
+
+    Parameters
+    ----------
+    date1: datetime64_like or (d, m, y): Start date(s).
+    date2: datetime64_like or (d, m, y): End date(s).
+
+    Returns
+    -------
+    T : float: Time in (trading) years between the two dates.
+
+    Example(s)
+    ----------
+    >>> dateToYears((1,1,2024), ['2025-01-01']*1000)[0]
+    >>> 1.0
+    >>> yearFracCache.info()['misses']
+    >>> 1
+
+    """
+    ends = asDates(date2).astype(np.int64)
+    return lookup(yearsBetween, date1, ends)
+
+def trDays(startD, T):
+    """Return total trading days from startD to T years from startD, memoized.
+
+    See calander.trDays, arrays broadcast.
+
+    Example(s)
+    ----------
+    >>> trDays('2024-01-01', [1.82, 1.82, .5])
+    >>> array([457, 457, 126])
+
+    """
+    return lookup(calander.trDays, startD, T).astype(np.int64)
+
+def oneDay(startD, T):
+    """Return time in years of one day over [startD, startD + T], memoized."""
+    return T / trDays(startD, T)
+
+def invalidate(calId=None):
+    """Drop cached values of a calander (all if None), see YearFracCache."""
+    yearFracCache.invalidate(calId)
+
+def info():
+    """Return the hit/miss counts of the shared cache."""
+    return yearFracCache.info()
@@ -1,10 +1,12 @@
-"""Test select functions from divHelper.py, Dividend class from Dividend.py"""
+"""Test select functions from resolveDateTime.py, Dividend class from Dividend.py"""
 
 import unittest
 import numpy as np
-import sys
-sys.path.append('../quantFinance/dividend')
-from divHelper import *
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../qf/helperFuncs'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../qf/dataContainers'))
+from resolveDateTime import *
+from Dividend import Dividend
 
 class Test_extractDiv(unittest.TestCase):
     """Test: 'overlapRange' function.
@@ -214,5 +216,49 @@ class Test_getTimes(unittest.TestCase):
         funcRes = getTimes(True, None, dates, np.datetime64('today'))
         self.assertIsNone(np.testing.assert_array_equal(ans, funcRes))
 
+class Test_discount(unittest.TestCase):
+    """Test: 'Dividend.discount' over arrays of rates and maturities.
+
+    See function documentation for more details.
+
+    """
+    def setUp(self):
+        self.div, self.times = np.array([.73, .82, .76, .8]), np.array([.5, 1, 1.5, 2])
+        self.q = Dividend(self.div, times=self.times)
+
+    def loopDiscount(self, r, T):
+        """Sum the discounted payouts at or before T, one at a time."""
+        return sum(d*np.exp(-r*t) for d, t in zip(self.div, self.times) if t <= T)
+
+    def test_matrix(self):
+        """Rates by maturities, only payouts by each maturity counted."""
+        r, T = np.array([0, .03, .05]), np.array([.25, .5, .75, 1.5, 2, 3])
+        res = self.q.discount(r[:, None], T)
+        ans = np.array([[self.loopDiscount(r_, T_) for T_ in T] for r_ in r])
+
+        self.assertEqual(res.shape, (3, 6))
+        self.assertIsNone(np.testing.assert_allclose(res, ans))
+        self.assertIsNone(np.testing.assert_allclose(
+            self.q.presentValue(r=r[:, None], T=T), ans))
+
+    def test_broadcast(self):
+        """Paired rates and maturities, and scalars."""
+        r, T = np.array([.03, .04, .05]), np.array([.75, 2.25, .1])
+        ans = [self.loopDiscount(r_, T_) for r_, T_ in zip(r, T)]
+        self.assertIsNone(np.testing.assert_allclose(self.q.discount(r, T), ans))
+        self.assertAlmostEqual(self.q.discount(.05, 2.25), self.loopDiscount(.05, 2.25))
+
+    def test_continuous(self):
+        """Continuous yield discounts each maturity."""
+        T = np.array([.5, 1, 2])
+        res = Dividend(.02).discount(T=T)
+        self.assertIsNone(np.testing.assert_allclose(res, np.exp(-.02*T)))
+
+        r = np.array([.03, .05])
+        res = Dividend(.02).discount(r[:, None], T)
+        self.assertEqual(res.shape, (2, 3))
+        self.assertIsNone(np.testing.assert_allclose(res[1], np.exp(-.02*T)))
+        self.assertIsInstance(Dividend(.02).discount(.05, 1.), float)
+
 if __name__ == '__main__':
     unittest.main()
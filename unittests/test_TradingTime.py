@@ -0,0 +1,34 @@
+"""Test time.TradingTime module."""
+
+import unittest
+import numpy as np
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../qf/time'))
+from TradingTime import TradingTime, TradingTimeArray
+
+class TestTradingTime(unittest.TestCase):
+    """Test: 'TradingTime' and 'TradingTimeArray'.
+
+    See class documentation for more details.
+
+    """
+    def test_init(self):
+        """The constructor splits the date into day, month and year."""
+        t = TradingTime('2024-03-01')
+        self.assertEqual((t.day, t.month, t.year), (1, 3, 2024))
+        self.assertEqual(t.date, np.datetime64('2024-03-01'))
+
+    def test_trYears(self):
+        """Years to an array of dates match the array difference."""
+        t = TradingTime('2024-03-01')
+        ends = ['2024-09-03', '2025-03-03']
+        np.testing.assert_allclose(t.trYears(ends),
+                                   TradingTimeArray(ends) - t.date)
+
+    def test_range(self):
+        """Times past 2049 raise instead of clamping to 12/31/2049."""
+        with self.assertRaises(ValueError):
+            TradingTimeArray('2049-06-01').trDays(1.)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Test helperFuncs.cache module."""
+
+import unittest
+import numpy as np
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../qf/helperFuncs'))
+from cache import LRUCache, cachedPhi
+
+def phiBSM(S, r, T, vol, q):
+    halfVar = vol**2 / 2
+    drft = np.log(S) + (r - q - halfVar)*T
+    return lambda u: np.exp(1j*u*drft - halfVar*T*u**2)
+
+class TestCachedPhi(unittest.TestCase):
+    """Test: 'cachedPhi' and 'LRUCache'.
+
+    See function documentation for more details.
+
+    """
+    def setUp(self):
+        """Use a fresh cache for every test."""
+        self.cache = LRUCache(maxBytes=2**20)
+        self.Y = np.arange(0, 128, 1/8)
+
+    def test_reuse(self):
+        """Repeated grids are served from the cache and are read-only."""
+        phi = cachedPhi(phiBSM, 100, .08, .5, .2, .004, cache=self.cache)
+        A, B = phi(self.Y - 1j), phi(self.Y - 1j)
+
+        self.assertIs(A, B)
+        self.assertTrue(np.allclose(A, phiBSM(100, .08, .5, .2, .004)(self.Y - 1j)))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+        self.assertFalse(A.flags.writeable)
+
+    def test_keys(self):
+        """New paramaters or a new grid are cache misses."""
+        cachedPhi(phiBSM, 100, .08, .5, .2, .004, cache=self.cache)(self.Y)
+        cachedPhi(phiBSM, 100, .08, .5, .25, .004, cache=self.cache)(self.Y)
+        cachedPhi(phiBSM, 100, .08, .5, .2, .004, cache=self.cache)(self.Y + 1)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 3))
+        self.assertEqual(len(self.cache), 3)
+
+    def test_closures(self):
+        """Vol-only closures of different stocks do not share grids."""
+        phiVol = lambda S: (lambda vol: phiBSM(S, .08, .5, vol, .004))
+        A = cachedPhi(phiVol(100), .2, cache=self.cache)(self.Y)
+        B = cachedPhi(phiVol(110), .2, cache=self.cache)(self.Y)
+
+        self.assertEqual((self.cache.hits, self.cache.misses), (0, 2))
+        self.assertFalse(np.allclose(A, B))
+
+    def test_scalar(self):
+        """Scalar inputs bypass the cache."""
+        phi = cachedPhi(phiBSM, 100, .08, .5, .2, .004, cache=self.cache)
+        self.assertAlmostEqual(phi(.5), phiBSM(100, .08, .5, .2, .004)(.5))
+        self.assertEqual(self.cache.info()['entries'], 0)
+
+    def test_eviction(self):
+        """Least recently used grids are evicted past the memory cap."""
+        cache = LRUCache(maxBytes=2.5 * self.Y.size * (16 + 8))
+        phi = cachedPhi(phiBSM, 100, .08, .5, .2, .004, cache=cache)
+        for shift in range(3):
+            phi(self.Y + shift)
+        phi(self.Y + 2)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.nbytes, cache.maxBytes)
+        self.assertEqual(cache.hits, 1)
+
+    def test_keyBytes(self):
+        """The grid bytes in the key count toward the memory used."""
+        phi = cachedPhi(phiBSM, 100, .08, .5, .2, .004, cache=self.cache)
+        phi(self.Y)
+        self.assertEqual(self.cache.nbytes, self.Y.nbytes + self.Y.size * 16)
+        self.cache.clear()
+        self.assertEqual(self.cache.nbytes, 0)
+        
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 """Unittests for calander.py"""
 
 import unittest
+import numpy as np
 import calander
 
 class leapYearTest(unittest.TestCase):
@@ -567,6 +568,55 @@ class tradingDaysTest(unittest.TestCase):
                 failMessage = f'{ans} trading days from {date20} to {date24}'
                 self.assertEqual(calander.tradingDays(date20, date24),
                                  ans, failMessage)
-    
+
+class engineTest(unittest.TestCase):
+    """Test of the array versions of 'dateToYears' and 'addYears'."""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.start = np.datetime64('2020-03-02')
+        self.ends = self.start + rng.integers(0, 5*365, 200)
+
+    def test_wholeYears(self):
+        """Test a year from new years is one trading year."""
+        for year in range(2005, 2040):
+            self.assertAlmostEqual(
+                calander.dateToYears((1, 1, year), (1, 1, year+1)), 1)
+
+    def test_arrays(self):
+        """Test array inputs agree with scalar inputs."""
+        T = calander.dateToYears(self.start, self.ends)
+        for end, T_ in zip(self.ends[:20], T):
+            self.assertEqual(calander.dateToYears(self.start, end), T_)
+            self.assertEqual(calander.tradingDays(self.start, end),
+                             calander.tradingDays((2, 3, 2020), end))
+
+    def test_addYears(self):
+        """Test 'addYears' inverts 'dateToYears' on trading days."""
+        isTrDay = np.is_busday(self.ends, busdaycal=calander.nyseCalendar)
+        ends = self.ends[isTrDay]
+        T = calander.dateToYears(self.start, ends)
+        np.testing.assert_array_equal(calander.addYears(T, self.start), ends)
+
+    def test_outOfRange(self):
+        """Test dates outside of 2000 - 2049 raise instead of wrapping."""
+        with self.assertRaises(ValueError):
+            calander.dateToYears((1, 12, 1999), (1, 1, 2020))
+        with self.assertRaises(ValueError):
+            calander.dateToYears((1, 1, 2020), (1, 1, 2051))
+        with self.assertRaises(ValueError):
+            calander.addYears(1, (1, 6, 2049))
+
+    def test_tradingDaysAnyYear(self):
+        """Test 'tradingDays' uses the NYSE holidays of years out of range."""
+        for year in [1995, 2060]:
+            days = np.arange(f'{year}-01-01', f'{year+1}-01-01',
+                             dtype='datetime64[D]')
+            holidays = calander.nyseHolidays(year, year+1)
+            ans = np.sum(np.is_busday(days, holidays=holidays))
+            self.assertEqual(calander.tradingDays((1, 1, year), (1, 1, year+1)),
+                             ans)
+            self.assertLess(ans, np.sum(np.is_busday(days)))
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,53 @@
+"""Test live.computeRate module with the market data stubbed."""
+
+import unittest
+from unittest import mock
+import types
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../qf/live'))
+
+class Reached(Exception):
+    """Raised by the stubbed ticker once the spot price is requested."""
+
+class Ticker:
+    """Offline stand-in for yfinance.Ticker."""
+
+    options = ('2024-03-15', '2024-06-21', '2025-01-17', '2025-03-21')
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+
+    def history(self, **kwargs):
+        raise Reached
+
+class TestGetRiskFreeRate(unittest.TestCase):
+    """Test: 'getRiskFreeRate' up to the first network call after the dates.
+
+    See function documentation for more details.
+
+    """
+    def setUp(self):
+        """Import computeRate with yfinance (and pandas if absent) stubbed."""
+        stubs = {'yfinance': types.SimpleNamespace(Ticker=Ticker)}
+        if 'pandas' not in sys.modules:
+            stubs['pandas'] = types.ModuleType('pandas')
+        patcher = mock.patch.dict(sys.modules, stubs)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        sys.modules.pop('computeRate', None)
+        import computeRate
+        self.computeRate = computeRate
+
+    def test_dates(self):
+        """The expiry T years out is found and converted to years."""
+        yearFrac = self.computeRate.yearFrac
+        with mock.patch.object(yearFrac, 'dateToYears',
+                               wraps=yearFrac.dateToYears) as dateToYears:
+            with self.assertRaises(Reached):
+                self.computeRate.getRiskFreeRate(1)
+        dateToYears.assert_called_once_with((15, 3, 2024), (17, 1, 2025))
+        self.assertAlmostEqual(yearFrac.dateToYears((15,3,2024), (17,1,2025)),
+                               .84, 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Test time.fastCalander module."""
+
+import unittest
+import numpy as np
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../qf/time'))
+import fastCalander
+
+class TestFastCalander(unittest.TestCase):
+    """Test: array-backed trading day functions.
+
+    See function documentation for more details.
+
+    """
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.dates = fastCalander.startD + rng.integers(0, 18000, 1000)
+
+    def test_tally(self):
+        """Tally is a compact, non-decreasing, unit step array."""
+        tally = fastCalander.trDaysTally
+        self.assertEqual(tally.dtype, np.int32)
+        self.assertTrue(set(np.unique(np.diff(tally))) <= {0, 1})
+
+    def test_vectorized(self):
+        """Array inputs agree with scalar inputs."""
+        arr = fastCalander.enumDate(self.dates)
+        scalar = [fastCalander.enumDate(d) for d in self.dates[:50]]
+        np.testing.assert_array_equal(arr[:50], scalar)
+
+        frac = fastCalander.fracYear(self.dates)
+        self.assertTrue(np.all((0 <= frac) & (frac <= 1)))
+
+    def test_trDays(self):
+        """trDays counts trading days on both ends and is symmetric."""
+        d1, d2 = self.dates[:-1], self.dates[1:]
+        np.testing.assert_array_equal(fastCalander.trDays(d1, d2),
+                                      fastCalander.trDays(d2, d1))
+
+        same = fastCalander.trDays(self.dates, self.dates)
+        isTr = fastCalander.isTradingDay(self.dates)
+        np.testing.assert_array_equal(same, isTr.astype(int))
+
+    def test_yearDays(self):
+        """Trading days in a year is the sum over its days."""
+        start = np.datetime64('2024-01-01')
+        allDays = start + np.arange(366)
+        self.assertEqual(fastCalander.days(2024),
+                         np.sum(fastCalander.isTradingDay(allDays)))
+
+    def test_range(self):
+        """Dates outside of 2000 - 2049 raise instead of wrapping around."""
+        last = np.datetime64('2049-12-31')
+        self.assertEqual(fastCalander.trDays(fastCalander.startD, last),
+                         fastCalander.trDaysYr(2000, 2050))
+        for date in ['1999-12-31', '2050-01-01']:
+            with self.assertRaises(ValueError):
+                fastCalander.enumDate(np.datetime64(date))
+        with self.assertRaises(ValueError):
+            fastCalander.trDays(np.datetime64('1999-12-01'), last)
+
+        june = np.datetime64('2049-06-01')
+        self.assertEqual(fastCalander.addYears(.5, june), np.datetime64('2049-11-29'))
+        with self.assertRaises(ValueError):
+            fastCalander.addYears(1., june)
+
+if __name__ == '__main__':
+    unittest.main()
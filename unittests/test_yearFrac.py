@@ -0,0 +1,73 @@
+"""Test time.yearFrac module."""
+
+import unittest
+import numpy as np
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '../qf/time'))
+import yearFrac
+import calander
+from yearFrac import YearFracCache, lookup
+
+class TestYearFrac(unittest.TestCase):
+    """Test: memoized 'dateToYears', 'trDays' and 'YearFracCache'.
+
+    See function documentation for more details.
+
+    """
+    def setUp(self):
+        """Use a fresh cache and a chain of 1000 options on 4 expiries."""
+        yearFrac.yearFracCache.clear()
+        self.start = np.datetime64('2024-03-01')
+        self.expiries = np.repeat(np.array(['2024-06-21', '2024-09-20',
+                                            '2024-12-20', '2025-06-20'],
+                                           dtype='datetime64[D]'), 250)
+
+    def tearDown(self):
+        calander.setHolidays(calander.nyseHolidays())
+
+    def test_values(self):
+        """Cached values agree with the calander engine."""
+        self.assertTrue(np.allclose(yearFrac.dateToYears(self.start, self.expiries),
+                                    calander.dateToYears(self.start, self.expiries)))
+        T = np.repeat([.1, .25, .5, 1.82], 250)
+        self.assertTrue(np.array_equal(yearFrac.trDays(self.start, T),
+                                       calander.trDays(self.start, T)))
+        self.assertEqual(yearFrac.trDays('2024-01-01', 1.82), 457)
+
+        rng = np.random.default_rng(0)
+        starts = self.start + rng.integers(0, 30, T.size)
+        T = rng.permutation(T)
+        self.assertTrue(np.array_equal(yearFrac.trDays(starts, T),
+                                       calander.trDays(starts, T)))
+        self.assertAlmostEqual(yearFrac.oneDay((1,1,2024), 2/252), 1/252)
+
+    def test_chain(self):
+        """Re-marking a chain computes each distinct expiry once."""
+        for _ in range(3):
+            yearFrac.dateToYears(self.start, self.expiries)
+        info = yearFrac.info()
+        self.assertEqual((info['misses'], info['hits'], info['entries']), (4, 8, 4))
+        self.assertAlmostEqual(info['hitRate'], 2/3)
+
+    def test_invalidate(self):
+        """A new holiday table is never served stale values."""
+        oldId = calander.calendarId
+        self.assertEqual(yearFrac.trDays('2024-01-01', .5), 126)
+        calander.setHolidays(np.append(calander.nyseHolidays(),
+                                       np.datetime64('2024-07-05')))
+        self.assertNotEqual(calander.calendarId, oldId)
+        self.assertEqual(yearFrac.trDays('2024-01-01', .5), 125)
+
+        yearFrac.invalidate(oldId)
+        info = yearFrac.info()
+        self.assertEqual((info['invalidations'], info['entries']), (1, 1))
+
+    def test_bound(self):
+        """The least recently used values are evicted past 'maxEntries'."""
+        cache = YearFracCache(maxEntries=3)
+        dates = self.start + np.arange(5)
+        lookup(calander.trDays, dates, .25, cache=cache)
+        self.assertEqual((len(cache), cache.evictions), (3, 2))
+
+if __name__ == '__main__':
+    unittest.main()